@@ -14,6 +14,9 @@ from ui.pages.positions import show_positions
 from ui.pages.history import show_history
 from ui.pages.settings import show_settings
 
+# Pages whose data refresh_all warms up front
+DATA_PAGES = ("Dashboard", "Positions", "History")
+
 def main():
     """Main application entry point"""
     st.set_page_config(
@@ -51,12 +54,25 @@ def main():
 
         # Connection status
         if st.session_state.client:
-            try:
-                account_info = st.session_state.client.get_account_info()
+            if page in DATA_PAGES:
+                # Warm every data page's sources in one concurrent round-trip
+                snapshot, errors = st.session_state.client.refresh_all()
+            else:
+                # Settings tests the connection itself, only the account is needed here
+                snapshot, errors = {}, {}
+                try:
+                    snapshot['account'] = st.session_state.client.get_account_info()
+                except Exception as e:
+                    errors['account'] = e
+
+            if 'account' in snapshot:
                 st.success("✅ Connected")
-                st.markdown(f"**Total Balance:** ${account_info.get('total_balance', 0):,.2f}")
-            except Exception as e:
-                st.error(f"❌ Connection Error: {e}")
+                st.markdown(f"**Total Balance:** ${snapshot['account'].get('total_balance', 0):,.2f}")
+            for source, error in errors.items():
+                if source == 'account':
+                    st.error(f"❌ Connection Error: {error}")
+                else:
+                    st.warning(f"⚠️ Failed to load {source}: {error}")
         else:
             st.error("❌ Not Connected")
 
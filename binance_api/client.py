@@ -1,17 +1,149 @@
 import time
+import hashlib
+import threading
+import numpy as np
 import pandas as pd
+import streamlit as st
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple
 from binance.client import Client as BinanceApiClient
 from binance.exceptions import BinanceAPIException, BinanceRequestException
+from requests.adapters import HTTPAdapter
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 from config.secrets import SecretsManager
 
+try:
+    import orjson
+except ImportError:  # optional, python-binance falls back to the stdlib json decoder
+    orjson = None
+
+# Raw API responses are memoized across Streamlit reruns. The client itself is
+# not hashable, so it is passed as an underscore argument and the credentials
+# fingerprint (`client_key`) is used to keep accounts apart in the cache.
+# This is the only cache of API data, so these are the real staleness bounds (seconds)
+ACCOUNT_CACHE_TTL = 30
+POSITIONS_CACHE_TTL = 30
+TRADES_CACHE_TTL = 60
+INCOME_CACHE_TTL = 300
+EXCHANGE_INFO_TTL = 60 * 60  # exchange info changes rarely
+
+# Keep-alive pool shared by every request of a client, so consecutive calls
+# reuse the TLS session instead of handshaking again
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 10
+
+# Position API field -> (output key, default), in output order
+_POSITION_FIELDS = {
+    'symbol': ('symbol', ''),
+    'positionSide': ('position_side', ''),
+    'positionAmt': ('size', 0.0),
+    'entryPrice': ('entry_price', 0.0),
+    'markPrice': ('mark_price', 0.0),
+    'unrealizedPnl': ('unrealized_pnl', 0.0),
+    'percentage': ('percentage', 0.0),
+    'leverage': ('leverage', 1.0),
+    'marginType': ('margin_type', ''),
+    'notional': ('notional', 0.0)
+}
+_POSITION_NUMERIC_FIELDS = [field for field, (_, default) in _POSITION_FIELDS.items() if isinstance(default, float)]
+
+# Column dtypes applied to the history frames in a single cast
+_TRADE_DTYPES = {
+    'symbol': 'string',
+    'side': 'category',
+    'qty': np.float64,
+    'quoteQty': np.float64,
+    'price': np.float64,
+    'commission': np.float64,
+    'time': np.int64
+}
+_INCOME_DTYPES = {
+    'income': np.float64,
+    'time': np.int64
+}
+
+class _PooledApiClient(BinanceApiClient):
+    """python-binance client backed by a sized keep-alive connection pool"""
+
+    def __init__(self, *args, **kwargs):
+        # python-binance keeps the last response on the instance; hold it per
+        # thread so concurrent requests (see refresh_all) can't swap bodies
+        self._local = threading.local()
+        super().__init__(*args, **kwargs)
+
+    @property
+    def response(self):
+        return getattr(self._local, 'response', None)
+
+    @response.setter
+    def response(self, value):
+        self._local.response = value
+
+    @staticmethod
+    def _handle_response(response):
+        """Decode responses with orjson when it is installed"""
+        if orjson is None:
+            return BinanceApiClient._handle_response(response)
+
+        if not (200 <= response.status_code < 300):
+            raise BinanceAPIException(response, response.status_code, response.text)
+
+        if not response.content:
+            return {}
+
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            raise BinanceRequestException("Invalid Response: %s" % response.text)
+
+    def _init_session(self):
+        session = super()._init_session()
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE)
+        session.mount('https://', adapter)
+        return session
+
+def script_context_executor(max_workers: int) -> ThreadPoolExecutor:
+    """Thread pool whose workers run under the calling script run's context"""
+    # st.cache_data looks up the ScriptRunContext, which is thread-local
+    return ThreadPoolExecutor(max_workers=max_workers, initializer=add_script_run_ctx, initargs=(None, get_script_run_ctx()))
+
+@st.cache_data(ttl=ACCOUNT_CACHE_TTL, show_spinner=False)
+def _fetch_account(_client: BinanceApiClient, client_key: str) -> Dict[str, Any]:
+    return _client.futures_account()
+
+@st.cache_data(ttl=POSITIONS_CACHE_TTL, show_spinner=False)
+def _fetch_positions(_client: BinanceApiClient, client_key: str) -> List[Dict[str, Any]]:
+    return _client.futures_position_information()
+
+@st.cache_data(ttl=TRADES_CACHE_TTL, show_spinner=False)
+def _fetch_trades(_client: BinanceApiClient, client_key: str, symbol: Optional[str], limit: int) -> List[Dict[str, Any]]:
+    return _client.futures_account_trades(symbol=symbol, limit=limit)
+
+@st.cache_data(ttl=INCOME_CACHE_TTL, show_spinner=False)
+def _fetch_income(_client: BinanceApiClient, client_key: str, symbol: Optional[str], limit: int) -> List[Dict[str, Any]]:
+    return _client.futures_income_history(symbol=symbol, limit=limit)
+
+@st.cache_resource(ttl=EXCHANGE_INFO_TTL, show_spinner=False)
+def _fetch_symbol_index(_client: BinanceApiClient, use_testnet: bool) -> Dict[str, Dict[str, Any]]:
+    # Exchange info is public, so one index per network is shared by every account
+    exchange_info = _client.futures_exchange_info()
+    return {sym_info.get('symbol'): sym_info for sym_info in exchange_info.get('symbols', [])}
+
+# Cache type -> memoized fetchers, for BinanceClient.clear_cache
+_CACHE_GROUPS = {
+    'account': (_fetch_account, _fetch_positions),
+    'history': (_fetch_trades, _fetch_income)
+}
+
 class BinanceClient:
     """Binance Futures API client wrapper"""
 
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.client = None
+        self.cache_key = ''
+        self.positions_update_time = None
         self.use_testnet = config.get('binance', {}).get('use_testnet', False)
         self.timeout = config.get('binance', {}).get('timeout', 30)
         self._initialize_client()
@@ -20,8 +152,7 @@ class BinanceClient:
         """Initialize the Binance API client"""
         try:
             # Try to get credentials from secure storage first
-            api_key = SecretsManager.get_api_key()
-            secret_key = SecretsManager.get_secret_key()
+            api_key, secret_key = SecretsManager.get_credentials()
 
             # Fallback to config (for temporary storage)
             if not api_key or not secret_key:
@@ -31,12 +162,15 @@ class BinanceClient:
             if not api_key or not secret_key:
                 raise ValueError("API credentials not found")
 
-            # Initialize client
-            self.client = BinanceApiClient(
+            # Initialize client; skip the constructor ping, test_connection() does that on demand
+            self.client = _PooledApiClient(
                 api_key=api_key,
                 api_secret=secret_key,
-                testnet=self.use_testnet
+                requests_params={'timeout': self.timeout},
+                testnet=self.use_testnet,
+                ping=False
             )
+            self.cache_key = hashlib.sha256(f"{api_key}:{self.use_testnet}".encode()).hexdigest()
 
         except Exception as e:
             raise Exception(f"Failed to initialize Binance client: {e}")
@@ -51,19 +185,40 @@ class BinanceClient:
         except Exception:
             return False
 
+    def refresh_all(self) -> Tuple[Dict[str, Any], Dict[str, Exception]]:
+        """Fetch account, positions and recent history concurrently, keeping failures per source"""
+        with script_context_executor(max_workers=4) as executor:
+            futures = {
+                'account': executor.submit(self.get_account_info),
+                'positions': executor.submit(self.get_positions),
+                'trades': executor.submit(self.get_transaction_history),
+                'income': executor.submit(self.get_income_history)
+            }
+
+        # One failing source (e.g. a missing permission) must not hide the others
+        results, errors = {}, {}
+        for name, future in futures.items():
+            error = future.exception()
+            if error is None:
+                results[name] = future.result()
+            else:
+                errors[name] = error
+        return results, errors
+
     def get_account_info(self) -> Dict[str, Any]:
         """Get futures account information"""
         try:
             if not self.client:
                 raise Exception("Client not initialized")
 
-            account = self.client.futures_account()
+            account = _fetch_account(self.client, self.cache_key)
 
             # Calculate total balance
-            total_balance = 0.0
-            for asset in account.get('assets', []):
-                if float(asset.get('walletBalance', 0)) > 0:
-                    total_balance += float(asset.get('walletBalance', 0))
+            assets = account.get('assets', [])
+            wallet_balances = np.fromiter(
+                (asset.get('walletBalance', 0) for asset in assets), dtype=np.float64, count=len(assets)
+            )
+            total_balance = float(wallet_balances[wallet_balances > 0].sum())
 
             return {
                 'total_balance': total_balance,
@@ -87,28 +242,22 @@ class BinanceClient:
             if not self.client:
                 raise Exception("Client not initialized")
 
-            positions = self.client.futures_position_information()
-
-            # Filter positions with non-zero size
-            active_positions = []
-            for pos in positions:
-                size = float(pos.get('positionAmt', 0))
-                if abs(size) > 0:  # Non-zero positions
-                    active_positions.append({
-                        'symbol': pos.get('symbol', ''),
-                        'position_side': pos.get('positionSide', ''),
-                        'size': size,
-                        'entry_price': float(pos.get('entryPrice', 0)),
-                        'mark_price': float(pos.get('markPrice', 0)),
-                        'unrealized_pnl': float(pos.get('unrealizedPnl', 0)),
-                        'percentage': float(pos.get('percentage', 0)),
-                        'leverage': float(pos.get('leverage', 1)),
-                        'margin_type': pos.get('marginType', ''),
-                        'notional': float(pos.get('notional', 0)),
-                        'update_time': datetime.now(timezone.utc).isoformat()
-                    })
-
-            return active_positions
+            positions = _fetch_positions(self.client, self.cache_key)
+
+            if not positions:
+                return []
+
+            # Cast every numeric column in one pass and keep non-zero positions
+            df = pd.DataFrame.from_records(positions).reindex(columns=list(_POSITION_FIELDS))
+            df = df.fillna({field: default for field, (_, default) in _POSITION_FIELDS.items()})
+            df = df.astype({field: np.float64 for field in _POSITION_NUMERIC_FIELDS})
+            df = df[df['positionAmt'].abs() > 0]
+            df = df.rename(columns={field: key for field, (key, _) in _POSITION_FIELDS.items()})
+            # The snapshot time is kept on the client rather than in every record,
+            # so identical positions hash the same in downstream st.cache_data keys
+            self.positions_update_time = datetime.now(timezone.utc).isoformat()
+
+            return df.to_dict('records')
 
         except BinanceAPIException as e:
             raise Exception(f"Binance API error: {e.message}")
@@ -121,25 +270,26 @@ class BinanceClient:
             if not self.client:
                 raise Exception("Client not initialized")
 
-            trades = self.client.futures_account_trades(symbol=symbol, limit=limit)
+            trades = _fetch_trades(self.client, self.cache_key, symbol, limit)
 
             if not trades:
                 return pd.DataFrame()
 
-            df = pd.DataFrame(trades)
-
-            # Convert relevant columns to numeric
-            numeric_columns = ['qty', 'quoteQty', 'price', 'commission']
-            for col in numeric_columns:
-                if col in df.columns:
-                    df[col] = pd.to_numeric(df[col], errors='coerce')
+            # Cast all typed columns at once
+            df = pd.DataFrame.from_records(trades)
+            df = df.astype({col: dtype for col, dtype in _TRADE_DTYPES.items() if col in df.columns})
 
             # Convert timestamp
             if 'time' in df.columns:
                 df['time'] = pd.to_datetime(df['time'], unit='ms')
 
             # Calculate profit/loss for closed positions
-            df['realized_pnl'] = df.apply(self._calculate_realized_pnl, axis=1)
+            # This is a placeholder - proper PnL calculation requires tracking position state,
+            # so for now it is the negative commission, computed for the whole column at once
+            df['realized_pnl'] = -df['commission'].fillna(0.0) if 'commission' in df.columns else 0.0
+
+            # Snapshot time for the whole frame rather than per row
+            df.attrs['update_time'] = datetime.now(timezone.utc).isoformat()
 
             return df
 
@@ -154,22 +304,21 @@ class BinanceClient:
             if not self.client:
                 raise Exception("Client not initialized")
 
-            income = self.client.futures_income_history(symbol=symbol, limit=limit)
+            income = _fetch_income(self.client, self.cache_key, symbol, limit)
 
             if not income:
                 return pd.DataFrame()
 
-            df = pd.DataFrame(income)
+            # Cast all typed columns at once
+            df = pd.DataFrame.from_records(income)
+            df = df.astype({col: dtype for col, dtype in _INCOME_DTYPES.items() if col in df.columns})
 
             # Convert timestamp
             if 'time' in df.columns:
                 df['time'] = pd.to_datetime(df['time'], unit='ms')
 
-            # Convert numeric columns
-            numeric_columns = ['income']
-            for col in numeric_columns:
-                if col in df.columns:
-                    df[col] = pd.to_numeric(df[col], errors='coerce')
+            # Snapshot time for the whole frame rather than per row
+            df.attrs['update_time'] = datetime.now(timezone.utc).isoformat()
 
             return df
 
@@ -184,27 +333,23 @@ class BinanceClient:
             if not self.client:
                 raise Exception("Client not initialized")
 
-            exchange_info = self.client.futures_exchange_info()
+            symbol_index = _fetch_symbol_index(self.client, self.use_testnet)
 
-            for sym_info in exchange_info.get('symbols', []):
-                if sym_info.get('symbol') == symbol:
-                    return sym_info
+            sym_info = symbol_index.get(symbol)
+            if sym_info is None:
+                raise Exception(f"Symbol {symbol} not found")
 
-            raise Exception(f"Symbol {symbol} not found")
+            return sym_info
 
         except BinanceAPIException as e:
             raise Exception(f"Binance API error: {e.message}")
         except Exception as e:
             raise Exception(f"Failed to get symbol info: {e}")
 
-    def _calculate_realized_pnl(self, row) -> float:
-        """Calculate realized PnL for a trade"""
-        # This is a simplified calculation
-        # In a real implementation, you'd need to track position opening/closing
-        side = row.get('side', '')
-        qty = float(row.get('qty', 0))
-        price = float(row.get('price', 0))
-        commission = float(row.get('commission', 0))
-
-        # This is a placeholder - proper PnL calculation requires tracking position state
-        return -commission  # Return negative commission for now
\ No newline at end of file
+    @staticmethod
+    def clear_cache(cache_type: str = 'all'):
+        """Drop memoized API responses ('all', 'account' or 'history') so the next call hits Binance"""
+        groups = _CACHE_GROUPS.values() if cache_type == 'all' else [_CACHE_GROUPS.get(cache_type, ())]
+        for group in groups:
+            for fetch in group:
+                fetch.clear()
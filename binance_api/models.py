@@ -1,9 +1,63 @@
+import numpy as np
+import pandas as pd
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from decimal import Decimal
 
-@dataclass
+# Model field order -> (API key, default) used by the bulk constructors
+ASSET_API_FIELDS = {
+    'symbol': ('asset', ''),
+    'wallet_balance': ('walletBalance', 0.0),
+    'unrealized_pnl': ('unrealizedPnl', 0.0),
+    'margin_balance': ('marginBalance', 0.0),
+    'maint_margin': ('maintMargin', 0.0),
+    'initial_margin': ('initialMargin', 0.0),
+    'position_initial_margin': ('positionInitialMargin', 0.0),
+    'open_order_initial_margin': ('openOrderInitialMargin', 0.0),
+    'cross_wallet_balance': ('crossWalletBalance', 0.0),
+    'cross_unpnl': ('crossUnPnl', 0.0),
+    'available_balance': ('availableBalance', 0.0),
+    'max_withdraw_amount': ('maxWithdrawAmount', 0.0),
+    'margin_available': ('marginAvailable', False)
+}
+
+POSITION_API_FIELDS = {
+    'symbol': ('symbol', ''),
+    'position_side': ('positionSide', ''),
+    'size': ('size', 0.0),
+    'entry_price': ('entryPrice', 0.0),
+    'mark_price': ('markPrice', 0.0),
+    'unrealized_pnl': ('unrealized_pnl', 0.0),
+    'percentage': ('percentage', 0.0),
+    'leverage': ('leverage', 1.0),
+    'margin_type': ('margin_type', ''),
+    'notional': ('notional', 0.0)
+}
+
+def _bulk_frame(rows: List[Dict[str, Any]], fields: Dict[str, tuple]) -> pd.DataFrame:
+    """Build a DataFrame of API rows, casting every non-string column in one pass"""
+    api_keys = [api_key for api_key, _ in fields.values()]
+    defaults = {api_key: default for api_key, default in fields.values()}
+
+    dtypes = {}
+    for api_key, default in defaults.items():
+        if isinstance(default, bool):
+            dtypes[api_key] = bool
+        elif isinstance(default, int):
+            dtypes[api_key] = np.int64
+        elif isinstance(default, float):
+            dtypes[api_key] = np.float64
+
+    df = pd.DataFrame.from_records(rows).reindex(columns=api_keys).fillna(defaults)
+    return df.astype(dtypes)
+
+def _bulk_columns(rows: List[Dict[str, Any]], fields: Dict[str, tuple]) -> List[list]:
+    """Cast API rows column-wise in one pass and return one list per model field"""
+    df = _bulk_frame(rows, fields)
+    return [df[api_key].tolist() for api_key, _ in fields.values()]
+
+@dataclass(slots=True, frozen=True)
 class Asset:
     """Represents an asset in the account"""
     symbol: str
@@ -41,7 +95,15 @@ class Asset:
             update_time=datetime.now()
         )
 
-@dataclass
+    @classmethod
+    def from_api_responses_bulk(cls, rows: List[Dict[str, Any]]) -> List['Asset']:
+        """Create Asset instances from a list of API responses"""
+        if not rows:
+            return []
+        update_time = datetime.now()
+        return [cls(*values, update_time=update_time) for values in zip(*_bulk_columns(rows, ASSET_API_FIELDS))]
+
+@dataclass(slots=True, frozen=True)
 class Position:
     """Represents a futures position"""
     symbol: str
@@ -73,6 +135,14 @@ class Position:
             update_time=datetime.now()
         )
 
+    @classmethod
+    def from_api_responses_bulk(cls, rows: List[Dict[str, Any]]) -> List['Position']:
+        """Create Position instances from a list of API responses"""
+        if not rows:
+            return []
+        update_time = datetime.now()
+        return [cls(*values, update_time=update_time) for values in zip(*_bulk_columns(rows, POSITION_API_FIELDS))]
+
     @property
     def is_long(self) -> bool:
         """Check if position is long"""
@@ -90,7 +160,7 @@ class Position:
             return 0.0
         return (self.mark_price - self.entry_price) / self.entry_price * 100 * (1 if self.is_long else -1)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Trade:
     """Represents a trade transaction"""
     symbol: str
@@ -119,7 +189,7 @@ class Trade:
             order_list_id=int(trade_data.get('orderListId', -1))
         )
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class IncomeRecord:
     """Represents an income record"""
     symbol: str
@@ -143,7 +213,7 @@ class IncomeRecord:
             trade_id=int(income_data.get('tradeId', 0))
         )
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AccountSummary:
     """Represents account summary information"""
     total_balance: float
@@ -158,8 +228,10 @@ class AccountSummary:
     @classmethod
     def from_api_response(cls, account_data: Dict[str, Any]) -> 'AccountSummary':
         """Create AccountSummary instance from API response"""
-        assets = [Asset.from_api_response(asset) for asset in account_data.get('assets', [])]
-        positions = [Position.from_api_response(pos) for pos in account_data.get('positions', []) if abs(float(pos.get('positionAmt', 0))) > 0]
+        assets = Asset.from_api_responses_bulk(account_data.get('assets', []))
+        positions = Position.from_api_responses_bulk(
+            [pos for pos in account_data.get('positions', []) if abs(float(pos.get('positionAmt', 0))) > 0]
+        )
 
         return cls(
             total_balance=float(account_data.get('total_balance', 0)),
@@ -185,4 +257,5 @@ class AccountSummary:
     @property
     def total_notional_value(self) -> float:
         """Calculate total notional value of all positions"""
-        return sum(pos.notional for pos in self.positions)
\ No newline at end of file
+        notional = np.fromiter((pos.notional for pos in self.positions), dtype=np.float64, count=len(self.positions))
+        return float(notional.sum())
\ No newline at end of file
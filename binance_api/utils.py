@@ -1,7 +1,8 @@
+import re
+import numpy as np
 import pandas as pd
 from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
-import pytz
+from datetime import datetime, timedelta, timezone
 
 def format_currency(amount: float, currency: str = "USDT", decimal_places: int = 2) -> str:
     """Format currency amount with proper formatting"""
@@ -22,6 +23,27 @@ def format_currency(amount: float, currency: str = "USDT", decimal_places: int =
 
     return f"{sign}${formatted} {currency}"
 
+# Magnitude thresholds, divisors and suffixes used by format_currency
+_CURRENCY_THRESHOLDS = np.array([1e3, 1e6, 1e9])
+_CURRENCY_DIVISORS = np.array([1.0, 1e3, 1e6, 1e9])
+_CURRENCY_SUFFIXES = np.array(['', 'K', 'M', 'B'])
+
+def format_currency_series(amounts: pd.Series, currency: Any = "USDT", decimal_places: int = 2) -> pd.Series:
+    """Format a whole column of currency amounts, same output as format_currency"""
+    values = amounts.to_numpy(dtype=np.float64)
+    abs_values = np.abs(values)
+    currency = np.asarray(currency, dtype=str)
+
+    # Branchless magnitude lookup instead of the if/elif chain
+    scale_idx = np.searchsorted(_CURRENCY_THRESHOLDS, abs_values, side='right')
+    scale_idx[np.isnan(abs_values)] = 0
+    numbers = np.char.mod(f"%.{decimal_places}f", abs_values / _CURRENCY_DIVISORS[scale_idx])
+
+    formatted = np.char.add(np.where(values < 0, "-$", "$"), numbers)
+    formatted = np.char.add(np.char.add(formatted, _CURRENCY_SUFFIXES[scale_idx]), " ")
+    formatted = np.where(values == 0, "$0.00 ", formatted)
+    return pd.Series(np.char.add(formatted, currency), index=amounts.index, dtype=object)
+
 def format_percentage(value: float, decimal_places: int = 2) -> str:
     """Format percentage with color coding"""
     if value == 0:
@@ -30,6 +52,13 @@ def format_percentage(value: float, decimal_places: int = 2) -> str:
     sign = "+" if value > 0 else ""
     return f"{sign}{value:.{decimal_places}f}%"
 
+def format_percentage_series(values: pd.Series, decimal_places: int = 2) -> pd.Series:
+    """Format a whole column of percentages, same output as format_percentage"""
+    arr = values.to_numpy(dtype=np.float64)
+    formatted = np.char.add(np.char.mod(f"%+.{decimal_places}f", arr), "%")
+    formatted = np.where(arr == 0, "0.00%", formatted)
+    return pd.Series(formatted, index=values.index, dtype=object)
+
 def get_pnl_color(pnl: float) -> str:
     """Get color based on PnL value"""
     if pnl > 0:
@@ -39,6 +68,11 @@ def get_pnl_color(pnl: float) -> str:
     else:
         return "gray"
 
+def get_pnl_color_series(pnl: pd.Series) -> pd.Series:
+    """Get colors for a whole column of PnL values"""
+    values = pnl.to_numpy(dtype=np.float64)
+    return pd.Series(np.select([values > 0, values < 0], ["green", "red"], default="gray"), index=pnl.index, dtype=object)
+
 def format_symbol(symbol: str) -> str:
     """Format trading symbol for display"""
     if '/' not in symbol:
@@ -50,9 +84,9 @@ def format_symbol(symbol: str) -> str:
 
 def calculate_time_ago(timestamp: datetime) -> str:
     """Calculate time ago from timestamp"""
-    now = datetime.now(pytz.UTC)
+    now = datetime.now(timezone.utc)
     if timestamp.tzinfo is None:
-        timestamp = pytz.UTC.localize(timestamp)
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
 
     diff = now - timestamp
 
@@ -67,6 +101,43 @@ def calculate_time_ago(timestamp: datetime) -> str:
     else:
         return "Just now"
 
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Indices kept by Largest-Triangle-Three-Buckets downsampling of a series"""
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        x = x.astype('int64')
+    x = x.astype(np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    # First and last points are always kept, the rest is split into n_out - 2 buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        # Average of the next bucket (the last point for the final bucket)
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+
+        # Keep the point forming the largest triangle with the previous pick and that average
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        keep[i + 1] = a
+
+    return keep
+
+def lttb_downsample(x: np.ndarray, y: np.ndarray, n_out: int = 500) -> tuple[np.ndarray, np.ndarray]:
+    """Downsample a series to about n_out points while keeping its visual shape"""
+    idx = lttb_indices(x, y, n_out)
+    return np.asarray(x)[idx], np.asarray(y)[idx]
+
 def round_to_precision(value: float, precision: int) -> float:
     """Round value to specified precision"""
     return round(value, precision)
@@ -91,38 +162,42 @@ def safe_int(value: Any, default: int = 0) -> int:
 
 def filter_dataframe(df: pd.DataFrame, filters: Dict[str, Any]) -> pd.DataFrame:
     """Apply filters to DataFrame"""
-    filtered_df = df.copy()
+    # Combine every condition into one mask and index the frame once
+    mask = np.ones(len(df), dtype=bool)
 
     for column, filter_value in filters.items():
-        if column in filtered_df.columns:
+        if column in df.columns:
             if isinstance(filter_value, (list, tuple)):
                 # Filter for multiple values
-                filtered_df = filtered_df[filtered_df[column].isin(filter_value)]
+                mask &= df[column].isin(filter_value).to_numpy()
             elif isinstance(filter_value, dict):
                 # Apply range filter
                 if 'min' in filter_value:
-                    filtered_df = filtered_df[filtered_df[column] >= filter_value['min']]
+                    mask &= (df[column] >= filter_value['min']).to_numpy()
                 if 'max' in filter_value:
-                    filtered_df = filtered_df[filtered_df[column] <= filter_value['max']]
+                    mask &= (df[column] <= filter_value['max']).to_numpy()
             else:
                 # Exact match
-                filtered_df = filtered_df[filtered_df[column] == filter_value]
+                mask &= (df[column] == filter_value).to_numpy()
 
-    return filtered_df
+    return df[mask]
 
 def get_date_range_preset(days: int) -> tuple[datetime, datetime]:
     """Get date range for preset number of days"""
-    end_date = datetime.now(pytz.UTC)
+    end_date = datetime.now(timezone.utc)
     start_date = end_date - timedelta(days=days)
     return start_date, end_date
 
+# At least 4 letters, digits, '_' or '-', with at least one letter or digit
+_VALID_SYMBOL = re.compile(r'(?=.*[A-Za-z0-9])[A-Za-z0-9_-]{4,}')
+
 def validate_symbol(symbol: str) -> bool:
     """Validate trading symbol format"""
     if not symbol:
         return False
 
     # Basic validation - should contain letters and possibly end with USDT
-    return len(symbol) >= 4 and symbol.replace('_', '').replace('-', '').isalnum()
+    return _VALID_SYMBOL.fullmatch(symbol) is not None
 
 def get_leverage_risk_score(leverage: float) -> Dict[str, Any]:
     """Get risk assessment based on leverage"""
@@ -167,9 +242,33 @@ def calculate_position_size_risk(position: Dict[str, Any]) -> Dict[str, Any]:
         size_risk = "Low"
         size_score = 1
 
+    leverage_risk = get_leverage_risk_score(leverage)
+
     return {
         "size_risk": size_risk,
         "size_score": size_score,
-        "leverage_risk": get_leverage_risk_score(leverage),
-        "total_risk_score": size_score + get_leverage_risk_score(leverage)["score"]
-    }
\ No newline at end of file
+        "leverage_risk": leverage_risk,
+        "total_risk_score": size_score + leverage_risk["score"]
+    }
+
+# Level labels indexed by risk score - 1, matching the scalar helpers
+_LEVERAGE_RISK_LEVELS = np.array(["Low", "Medium", "High", "Very High"])
+_SIZE_RISK_LEVELS = np.array(["Low", "Medium", "High"])
+
+def get_leverage_risk_scores(leverage: np.ndarray) -> np.ndarray:
+    """Vectorized leverage risk score (1-4) per position, see get_leverage_risk_score"""
+    return np.digitize(np.asarray(leverage, dtype=np.float64), [2, 5, 10], right=True) + 1
+
+def get_size_risk_scores(notional: np.ndarray) -> np.ndarray:
+    """Vectorized position size risk score (1-3) per position, see calculate_position_size_risk"""
+    return np.digitize(np.abs(np.asarray(notional, dtype=np.float64)), [5000, 10000]) + 1
+
+def position_risk_frame(notional: pd.Series, leverage: pd.Series) -> pd.DataFrame:
+    """Size/leverage risk levels and total score per position, computed column-wise"""
+    size_scores = get_size_risk_scores(notional)
+    leverage_scores = get_leverage_risk_scores(leverage)
+    return pd.DataFrame({
+        'size_risk': _SIZE_RISK_LEVELS[size_scores - 1],
+        'leverage_risk': _LEVERAGE_RISK_LEVELS[leverage_scores - 1],
+        'total_risk_score': size_scores + leverage_scores
+    }, index=notional.index)
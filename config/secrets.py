@@ -1,9 +1,13 @@
 """Secure management of API keys and sensitive information"""
 
 import os
+import re
 import streamlit as st
 from typing import Optional
 
+# Binance API and secret keys are alphanumeric, typically 64 characters
+_KEY_PATTERN = re.compile(r"[A-Za-z0-9]{20,128}")
+
 class SecretsManager:
     """Manages sensitive configuration securely"""
 
@@ -27,17 +31,26 @@ class SecretsManager:
         # Fall back to environment variables
         return os.getenv('BINANCE_SECRET_KEY')
 
+    @staticmethod
+    def get_credentials() -> tuple[Optional[str], Optional[str]]:
+        """Get Binance API key and secret key with a single storage lookup"""
+        # Try Streamlit secrets first (for deployment)
+        if hasattr(st, 'secrets'):
+            secrets = st.secrets
+            if 'BINANCE_API_KEY' in secrets and 'BINANCE_SECRET_KEY' in secrets:
+                return secrets['BINANCE_API_KEY'], secrets['BINANCE_SECRET_KEY']
+
+        # Fall back to environment variables
+        return SecretsManager.get_api_key(), SecretsManager.get_secret_key()
+
     @staticmethod
     def validate_credentials(api_key: str, secret_key: str) -> bool:
         """Validate that credentials are properly formatted"""
         if not api_key or not secret_key:
             return False
 
-        # Basic validation - API keys are typically 64 characters
-        if len(api_key) < 20 or len(secret_key) < 20:
-            return False
-
-        return True
+        # Basic format validation with the pattern compiled at import
+        return bool(_KEY_PATTERN.fullmatch(api_key) and _KEY_PATTERN.fullmatch(secret_key))
 
     @staticmethod
     def store_temp_credentials(api_key: str, secret_key: str) -> bool:
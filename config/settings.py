@@ -1,14 +1,55 @@
 import os
+import copy
 import toml
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
 from typing import Dict, Any
 
+try:
+    import rtoml
+except ImportError:  # optional, the pure-Python toml package is used instead
+    rtoml = None
+
 # Load environment variables
 load_dotenv()
 
+CONFIG_PATH = Path("config.toml")
+SENSITIVE_KEYS = ("api_key", "secret_key")
+
+def get_config_mtime() -> float:
+    """Modification time of config.toml, 0 when the file is missing"""
+    try:
+        return CONFIG_PATH.stat().st_mtime
+    except OSError:
+        return 0.0
+
 def load_config() -> Dict[str, Any]:
     """Load configuration from TOML file and environment variables"""
+    # Callers modify the returned dict, so hand out a copy of the cached one
+    return copy.deepcopy(_read_config(get_config_mtime()))
+
+def load_safe_config() -> Dict[str, Any]:
+    """Load configuration without credentials, for display only"""
+    # Shared between callers, treat as read-only
+    return _read_safe_config(get_config_mtime())
+
+@lru_cache(maxsize=1)
+def _read_safe_config(mtime: float) -> Dict[str, Any]:
+    """Scrub credentials from the cached configuration"""
+    return scrub_config(_read_config(mtime))
+
+def scrub_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of the configuration without credentials, the input is left untouched"""
+    return {
+        section: {key: value for key, value in values.items() if key not in SENSITIVE_KEYS}
+        if isinstance(values, dict) else values
+        for section, values in config.items()
+    }
+
+@lru_cache(maxsize=1)
+def _read_config(mtime: float) -> Dict[str, Any]:
+    """Read and merge the configuration, once per config.toml revision"""
 
     # Default configuration
     default_config = {
@@ -29,10 +70,9 @@ def load_config() -> Dict[str, Any]:
     }
 
     # Try to load from config file
-    config_path = Path("config.toml")
-    if config_path.exists():
+    if mtime:
         try:
-            file_config = toml.load(config_path)
+            file_config = rtoml.load(CONFIG_PATH) if rtoml else toml.load(CONFIG_PATH)
             # Merge with defaults
             for section in default_config:
                 if section in file_config:
@@ -67,16 +107,24 @@ def get_env_var(key: str, default: Any = None) -> Any:
 def save_config(config: Dict[str, Any]) -> bool:
     """Save configuration to TOML file"""
     try:
-        config_path = Path("config.toml")
         # Don't save sensitive information
-        safe_config = config.copy()
-        if "api_key" in safe_config.get("binance", {}):
-            del safe_config["binance"]["api_key"]
-        if "secret_key" in safe_config.get("binance", {}):
-            del safe_config["binance"]["secret_key"]
-
-        with open(config_path, "w") as f:
-            toml.dump(safe_config, f)
+        safe_config = scrub_config(config)
+
+        # Write a sibling temp file and swap it in, so a failed write never
+        # leaves a truncated config.toml behind
+        tmp_path = CONFIG_PATH.with_name(f".{CONFIG_PATH.name}.tmp")
+        try:
+            with open(tmp_path, "w") as f:
+                if rtoml:
+                    rtoml.dump(safe_config, f)
+                else:
+                    toml.dump(safe_config, f)
+            os.replace(tmp_path, CONFIG_PATH)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        # mtime resolution can be coarse, don't rely on it alone after a write
+        _read_config.cache_clear()
+        _read_safe_config.cache_clear()
         return True
     except Exception as e:
         print(f"Error saving config: {e}")
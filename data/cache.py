@@ -1,194 +1,37 @@
-import time
-import hashlib
-import pickle
+import numpy as np
+import pandas as pd
 from typing import Any, Optional, Dict
-from datetime import datetime, timedelta
 import streamlit as st
+from binance_api.client import BinanceClient
+from data.processor import DataProcessor
 
-class CacheManager:
-    """Manages data caching for the application"""
-
-    def __init__(self, default_timeout: int = 60):
-        self.default_timeout = default_timeout
-        self.cache_key_prefix = "binance_dashboard_"
-
-    def get_cache_key(self, key: str, *args) -> str:
-        """Generate a unique cache key"""
-        if args:
-            # Create a hash of arguments to include in key
-            args_str = str(sorted(args))
-            args_hash = hashlib.md5(args_str.encode()).hexdigest()[:8]
-            return f"{self.cache_key_prefix}{key}_{args_hash}"
-        return f"{self.cache_key_prefix}{key}"
-
-    def get(self, key: str, default: Any = None) -> Any:
-        """Get cached value"""
-        cache_key = self.get_cache_key(key)
-
-        if cache_key in st.session_state:
-            cached_item = st.session_state[cache_key]
-            if isinstance(cached_item, dict) and 'data' in cached_item and 'timestamp' in cached_item:
-                # Check if cache is still valid
-                if time.time() - cached_item['timestamp'] < cached_item['timeout']:
-                    return cached_item['data']
-                else:
-                    # Cache expired, remove it
-                    del st.session_state[cache_key]
-
-        return default
-
-    def set(self, key: str, value: Any, timeout: Optional[int] = None) -> None:
-        """Set cached value with timeout"""
-        if timeout is None:
-            timeout = self.default_timeout
-
-        cache_key = self.get_cache_key(key)
-        st.session_state[cache_key] = {
-            'data': value,
-            'timestamp': time.time(),
-            'timeout': timeout
-        }
-
-    def clear(self, key: Optional[str] = None) -> None:
-        """Clear cache entry or all cache"""
-        if key:
-            cache_key = self.get_cache_key(key)
-            if cache_key in st.session_state:
-                del st.session_state[cache_key]
-        else:
-            # Clear all cache entries
-            keys_to_remove = [k for k in st.session_state.keys() if k.startswith(self.cache_key_prefix)]
-            for k in keys_to_remove:
-                del st.session_state[k]
-
-    def is_expired(self, key: str) -> bool:
-        """Check if cache entry is expired"""
-        cache_key = self.get_cache_key(key)
-
-        if cache_key in st.session_state:
-            cached_item = st.session_state[cache_key]
-            if isinstance(cached_item, dict) and 'timestamp' in cached_item:
-                return time.time() - cached_item['timestamp'] >= cached_item['timeout']
-
-        return True
-
-    def get_or_compute(self, key: str, compute_func, timeout: Optional[int] = None, *args, **kwargs):
-        """Get cached value or compute if not exists/expired"""
-        # Generate cache key with arguments
-        if args:
-            cache_key = self.get_cache_key(key, *args)
-        else:
-            cache_key = self.get_cache_key(key)
-
-        # Try to get from cache
-        if not self.is_expired(key):
-            cached_value = self.get(key)
-            if cached_value is not None:
-                return cached_value
-
-        # Compute value
-        value = compute_func(*args, **kwargs)
-
-        # Cache the result
-        self.set(key, value, timeout)
-
-        return value
-
-    def get_cache_stats(self) -> Dict[str, Any]:
-        """Get cache statistics"""
-        cache_keys = [k for k in st.session_state.keys() if k.startswith(self.cache_key_prefix)]
-
-        total_entries = len(cache_keys)
-        expired_entries = 0
-        total_size = 0
-
-        for key in cache_keys:
-            if key in st.session_state:
-                cached_item = st.session_state[key]
-                if isinstance(cached_item, dict):
-                    total_size += len(pickle.dumps(cached_item))
-                    if 'timestamp' in cached_item:
-                        if time.time() - cached_item['timestamp'] >= cached_item['timeout']:
-                            expired_entries += 1
-
-        return {
-            'total_entries': total_entries,
-            'expired_entries': expired_entries,
-            'valid_entries': total_entries - expired_entries,
-            'total_size_bytes': total_size,
-            'total_size_mb': round(total_size / (1024 * 1024), 2)
-        }
-
+# The client memoizes raw responses with st.cache_data (see binance_api.client),
+# that single layer owns the TTLs; CachedAPI is the entry point the pages use
 class CachedAPI:
     """Wrapper for API calls with caching"""
 
-    def __init__(self, cache_manager: CacheManager):
-        self.cache = cache_manager
-
-    def cached_account_info(self, client, timeout: int = 30) -> Dict[str, Any]:
+    def cached_account_info(self, client) -> Dict[str, Any]:
         """Cached account info"""
-        return self.cache.get_or_compute(
-            'account_info',
-            lambda: client.get_account_info(),
-            timeout
-        )
+        return client.get_account_info()
 
-    def cached_positions(self, client, timeout: int = 30) -> list:
+    def cached_positions(self, client) -> list:
         """Cached positions"""
-        return self.cache.get_or_compute(
-            'positions',
-            lambda: client.get_positions(),
-            timeout
-        )
+        return client.get_positions()
 
-    def cached_transaction_history(self, client, symbol: Optional[str] = None, limit: int = 100, timeout: int = 60) -> Any:
+    def cached_transaction_history(self, client, symbol: Optional[str] = None, limit: int = 100) -> Any:
         """Cached transaction history"""
-        cache_key = 'transaction_history'
-        if symbol:
-            cache_key = f'transaction_history_{symbol}'
-
-        return self.cache.get_or_compute(
-            cache_key,
-            lambda: client.get_transaction_history(symbol, limit),
-            timeout,
-            symbol,
-            limit
-        )
-
-    def cached_income_history(self, client, symbol: Optional[str] = None, limit: int = 100, timeout: int = 300) -> Any:
+        return client.get_transaction_history(symbol, limit)
+
+    def cached_income_history(self, client, symbol: Optional[str] = None, limit: int = 100) -> Any:
         """Cached income history (longer timeout)"""
-        cache_key = 'income_history'
-        if symbol:
-            cache_key = f'income_history_{symbol}'
-
-        return self.cache.get_or_compute(
-            cache_key,
-            lambda: client.get_income_history(symbol, limit),
-            timeout,
-            symbol,
-            limit
-        )
+        return client.get_income_history(symbol, limit)
 
     def invalidate_cache(self, cache_type: str = 'all') -> None:
         """Invalidate specific or all cache entries"""
-        if cache_type == 'all':
-            self.cache.clear()
-        elif cache_type == 'account':
-            self.cache.clear('account_info')
-            self.cache.clear('positions')
-        elif cache_type == 'history':
-            self.cache.clear('transaction_history')
-            self.cache.clear('income_history')
-        else:
-            self.cache.clear(cache_type)
-
-# Global cache instance
-_cache_manager = CacheManager()
-_cached_api = CachedAPI(_cache_manager)
-
-def get_cache_manager() -> CacheManager:
-    """Get global cache manager instance"""
-    return _cache_manager
+        BinanceClient.clear_cache(cache_type)
+
+# Global cached API instance
+_cached_api = CachedAPI()
 
 def get_cached_api() -> CachedAPI:
     """Get global cached API instance"""
@@ -222,12 +65,35 @@ def cached_calculate_metrics(positions_data: list) -> dict:
     if not positions_data:
         return {'total_notional': 0, 'total_pnl': 0, 'count': 0}
 
-    total_notional = sum(abs(pos.get('notional', 0)) for pos in positions_data)
-    total_pnl = sum(pos.get('unrealized_pnl', 0) for pos in positions_data)
+    notional = np.asarray([pos.get('notional', 0) for pos in positions_data], dtype=np.float64)
+    pnl = np.asarray([pos.get('unrealized_pnl', 0) for pos in positions_data], dtype=np.float64)
+    total_notional = float(np.abs(notional).sum())
 
     return {
         'total_notional': total_notional,
-        'total_pnl': total_pnl,
+        'total_pnl': float(pnl.sum()),
         'count': len(positions_data),
-        'avg_notional': total_notional / len(positions_data) if positions_data else 0
-    }
\ No newline at end of file
+        'avg_notional': total_notional / len(positions_data)
+    }
+
+@st.cache_data(ttl=30, max_entries=8, show_spinner=False)
+def _process_account_summary(account_data: Dict[str, Any]) -> Dict[str, Any]:
+    return DataProcessor().process_account_summary(account_data)
+
+def cached_process_account_summary(account_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Cache account summary processing across reruns"""
+    # get_account_info stamps a fresh update_time on every call, which would make
+    # every lookup a miss; the summary doesn't read it, so leave it out of the key
+    return _process_account_summary({key: value for key, value in account_data.items() if key != 'update_time'})
+
+# Position records carry only the position fields (no per-call snapshot time),
+# so identical positions map to the same entry; one entry per page column set
+@st.cache_data(ttl=30, max_entries=8, show_spinner=False)
+def cached_process_positions_frame(positions: list, columns: Optional[tuple] = None) -> pd.DataFrame:
+    """Cache the processed positions frame, narrowed to the given columns"""
+    return DataProcessor().process_positions_frame(positions, list(columns) if columns else None)
+
+@st.cache_data(ttl=300, show_spinner=False)
+def cached_csv_bytes(df: pd.DataFrame) -> bytes:
+    """Cache CSV export payloads so repeated downloads reuse the bytes"""
+    return df.to_csv(index=False).encode('utf-8')
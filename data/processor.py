@@ -1,8 +1,33 @@
+from functools import lru_cache
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
-from binance_api.models import Trade, Position, AccountSummary, Asset
-from binance_api.utils import safe_float, format_currency, format_percentage
+from binance_api.models import Trade, Position, AccountSummary
+from binance_api.utils import (
+    format_currency, format_currency_series, format_percentage_series, get_pnl_color_series
+)
+
+# Numeric position fields with the default used when the key is missing
+_POSITION_NUMERIC_DEFAULTS = {
+    'size': 0.0,
+    'entry_price': 0.0,
+    'mark_price': 0.0,
+    'unrealized_pnl': 0.0,
+    'leverage': 1.0,
+    'notional': 0.0
+}
+
+def _positions_to_arrays(positions: List[Position]):
+    """Column arrays (notional, pnl, size, leverage) of a position list"""
+    # One generator pass filling an (N, 4) array, then split into columns
+    rows = np.fromiter(
+        ((pos.notional, pos.unrealized_pnl, pos.size, pos.leverage) for pos in positions),
+        dtype=(np.float64, 4),
+        count=len(positions)
+    )
+    notional, pnl, size, leverage = rows.T
+    return notional, pnl, size, leverage
 
 class DataProcessor:
     """Processes and analyzes trading data"""
@@ -14,13 +39,31 @@ class DataProcessor:
         """Process account summary data for display"""
         summary = AccountSummary.from_api_response(account_data)
 
-        # Calculate additional metrics
-        total_investment = sum(asset.wallet_balance for asset in summary.assets if asset.symbol != 'USDT')
-        usdt_balance = next((asset.wallet_balance for asset in summary.assets if asset.symbol == 'USDT'), 0)
+        # One pass over the assets for the balances and the display rows
+        total_investment = 0.0
+        usdt_balance = None
+        processed_assets = []
+        for asset in summary.assets:
+            if asset.symbol == 'USDT':
+                if usdt_balance is None:
+                    usdt_balance = asset.wallet_balance
+            else:
+                total_investment += asset.wallet_balance
 
-        # Calculate portfolio metrics
-        active_positions_value = sum(abs(pos.notional) for pos in summary.positions)
-        total_exposure = active_positions_value
+            if asset.wallet_balance > 0:  # Only show assets with balance
+                processed_assets.append({
+                    'symbol': asset.symbol,
+                    'balance': asset.wallet_balance,
+                    'formatted_balance': format_currency(asset.wallet_balance, asset.symbol),
+                    'unrealized_pnl': asset.unrealized_pnl,
+                    'formatted_pnl': format_currency(asset.unrealized_pnl),
+                    'available_balance': asset.available_balance,
+                    'margin_balance': asset.margin_balance
+                })
+
+        # Calculate portfolio metrics, the exposure is the summary's notional total
+        positions_summary = self._summarize_positions(summary.positions)
+        total_exposure = positions_summary['total_notional']
         leverage_usage = (total_exposure / summary.total_balance) if summary.total_balance > 0 else 0
 
         return {
@@ -32,29 +75,13 @@ class DataProcessor:
             'active_positions': summary.active_positions_count,
             'total_exposure': total_exposure,
             'leverage_usage': leverage_usage,
-            'usdt_balance': usdt_balance,
+            'usdt_balance': usdt_balance if usdt_balance is not None else 0,
             'other_assets_balance': total_investment,
             'update_time': summary.update_time,
-            'assets': self._process_assets(summary.assets),
-            'positions_summary': self._summarize_positions(summary.positions)
+            'assets': processed_assets,
+            'positions_summary': positions_summary
         }
 
-    def _process_assets(self, assets: List[Asset]) -> List[Dict[str, Any]]:
-        """Process asset list for display"""
-        processed_assets = []
-        for asset in assets:
-            if asset.wallet_balance > 0:  # Only show assets with balance
-                processed_assets.append({
-                    'symbol': asset.symbol,
-                    'balance': asset.wallet_balance,
-                    'formatted_balance': format_currency(asset.wallet_balance, asset.symbol),
-                    'unrealized_pnl': asset.unrealized_pnl,
-                    'formatted_pnl': format_currency(asset.unrealized_pnl),
-                    'available_balance': asset.available_balance,
-                    'margin_balance': asset.margin_balance
-                })
-        return processed_assets
-
     def _summarize_positions(self, positions: List[Position]) -> Dict[str, Any]:
         """Create summary of positions"""
         if not positions:
@@ -66,11 +93,13 @@ class DataProcessor:
                 'avg_leverage': 1.0
             }
 
-        total_notional = sum(abs(pos.notional) for pos in positions)
-        total_unrealized_pnl = sum(pos.unrealized_pnl for pos in positions)
-        long_positions = sum(1 for pos in positions if pos.is_long)
-        short_positions = sum(1 for pos in positions if pos.is_short)
-        avg_leverage = sum(pos.leverage for pos in positions) / len(positions)
+        notional, pnl, size, leverage = _positions_to_arrays(positions)
+
+        total_notional = float(np.abs(notional).sum())
+        total_unrealized_pnl = float(pnl.sum())
+        long_positions = int(np.count_nonzero(size > 0))
+        short_positions = int(np.count_nonzero(size < 0))
+        avg_leverage = float(leverage.mean())
 
         return {
             'total_notional': total_notional,
@@ -93,11 +122,10 @@ class DataProcessor:
                 'trades_by_day': pd.DataFrame()
             }
 
-        # Ensure data types
+        # Ensure data types, coercing the present columns in one assign
         numeric_columns = ['qty', 'quoteQty', 'price', 'commission', 'realized_pnl']
-        for col in numeric_columns:
-            if col in trades_df.columns:
-                trades_df[col] = pd.to_numeric(trades_df[col], errors='coerce')
+        num_cols = [c for c in numeric_columns if c in trades_df.columns]
+        trades_df = trades_df.assign(**{c: pd.to_numeric(trades_df[c], errors='coerce') for c in num_cols})
 
         # Basic statistics
         total_trades = len(trades_df)
@@ -107,25 +135,23 @@ class DataProcessor:
         # Trade analysis
         avg_trade_size = trades_df['qty'].mean() if 'qty' in trades_df.columns else 0
 
+        agg_spec = {
+            'qty': 'count',
+            'quoteQty': 'sum',
+            'commission': 'sum'
+        }
+
         # Group by symbol
         trades_by_symbol = {}
         if 'symbol' in trades_df.columns:
-            symbol_stats = trades_df.groupby('symbol').agg({
-                'qty': 'count',
-                'quoteQty': 'sum',
-                'commission': 'sum'
-            }).rename(columns={'qty': 'trade_count'})
+            symbol_stats = trades_df.groupby('symbol', sort=False, observed=True).agg(agg_spec).rename(columns={'qty': 'trade_count'})
             trades_by_symbol = symbol_stats.to_dict('index')
 
-        # Group by day
+        # Group by day, keeping the key as datetime64 instead of Python dates
         trades_by_day = pd.DataFrame()
         if 'time' in trades_df.columns:
-            trades_df['date'] = pd.to_datetime(trades_df['time']).dt.date
-            daily_stats = trades_df.groupby('date').agg({
-                'qty': 'count',
-                'quoteQty': 'sum',
-                'commission': 'sum'
-            }).rename(columns={'qty': 'trade_count'})
+            date = pd.to_datetime(trades_df['time']).dt.floor('D').rename('date')
+            daily_stats = trades_df.groupby(date).agg(agg_spec).rename(columns={'qty': 'trade_count'})
             trades_by_day = daily_stats
 
         return {
@@ -137,51 +163,73 @@ class DataProcessor:
             'trades_by_day': trades_by_day
         }
 
-    def process_positions_data(self, positions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Process positions data for display"""
-        processed_positions = []
-
-        for pos in positions:
-            # Calculate metrics
-            size = safe_float(pos.get('size', 0))
-            entry_price = safe_float(pos.get('entry_price', 0))
-            mark_price = safe_float(pos.get('mark_price', 0))
-            unrealized_pnl = safe_float(pos.get('unrealized_pnl', 0))
-            leverage = safe_float(pos.get('leverage', 1))
-            notional = safe_float(pos.get('notional', 0))
-
-            # Calculate PnL percentage
-            pnl_percentage = 0
-            if entry_price > 0:
-                pnl_percentage = ((mark_price - entry_price) / entry_price * 100) * (1 if size > 0 else -1)
-
-            processed_position = {
-                'symbol': pos.get('symbol', ''),
-                'formatted_symbol': self._format_symbol(pos.get('symbol', '')),
-                'side': 'LONG' if size > 0 else 'SHORT',
-                'size': abs(size),
-                'formatted_size': f"{abs(size):.4f}",
-                'entry_price': entry_price,
-                'formatted_entry_price': f"{entry_price:.4f}",
-                'mark_price': mark_price,
-                'formatted_mark_price': f"{mark_price:.4f}",
-                'unrealized_pnl': unrealized_pnl,
-                'formatted_pnl': format_currency(unrealized_pnl),
-                'pnl_percentage': pnl_percentage,
-                'formatted_percentage': format_percentage(pnl_percentage),
-                'leverage': leverage,
-                'notional': abs(notional),
-                'formatted_notional': format_currency(abs(notional)),
-                'margin_type': pos.get('margin_type', 'cross'),
-                'pnl_color': 'green' if unrealized_pnl > 0 else 'red' if unrealized_pnl < 0 else 'gray'
-            }
+    def build_positions_frame(self, positions: List[Dict[str, Any]]) -> pd.DataFrame:
+        """Build the processed positions table with column-wise formatting"""
+        raw = pd.DataFrame.from_records(positions)
+
+        numeric = {}
+        for col, default in _POSITION_NUMERIC_DEFAULTS.items():
+            if col in raw.columns:
+                numeric[col] = pd.to_numeric(raw[col], errors='coerce').fillna(default).to_numpy(dtype=np.float64)
+            else:
+                numeric[col] = np.full(len(raw), default)
+
+        size = numeric['size']
+        entry_price = numeric['entry_price']
+        mark_price = numeric['mark_price']
+        notional = np.abs(numeric['notional'])
+        abs_size = np.abs(size)
+
+        # Calculate PnL percentage, zero where there is no entry price
+        direction = np.where(size > 0, 1.0, -1.0)
+        safe_entry = np.where(entry_price > 0, entry_price, 1.0)
+        pnl_percentage = np.where(entry_price > 0, (mark_price - entry_price) / safe_entry * 100 * direction, 0.0)
+
+        symbol = raw['symbol'].fillna('') if 'symbol' in raw.columns else pd.Series('', index=raw.index)
+        margin_type = raw['margin_type'].fillna('cross') if 'margin_type' in raw.columns else pd.Series('cross', index=raw.index)
+
+        df = pd.DataFrame({
+            'symbol': symbol,
+            'formatted_symbol': symbol.map(self._format_symbol),
+            'side': np.where(size > 0, 'LONG', 'SHORT'),
+            'size': abs_size,
+            'formatted_size': np.char.mod('%.4f', abs_size),
+            'entry_price': entry_price,
+            'formatted_entry_price': np.char.mod('%.4f', entry_price),
+            'mark_price': mark_price,
+            'formatted_mark_price': np.char.mod('%.4f', mark_price),
+            'unrealized_pnl': numeric['unrealized_pnl'],
+            'pnl_percentage': pnl_percentage,
+            'leverage': numeric['leverage'],
+            'notional': notional,
+            'margin_type': margin_type
+        }, index=raw.index)
+
+        df.insert(df.columns.get_loc('pnl_percentage'), 'formatted_pnl', format_currency_series(df['unrealized_pnl']))
+        df.insert(df.columns.get_loc('leverage'), 'formatted_percentage', format_percentage_series(df['pnl_percentage']))
+        df.insert(df.columns.get_loc('margin_type'), 'formatted_notional', format_currency_series(df['notional']))
+        df['pnl_color'] = get_pnl_color_series(df['unrealized_pnl'])
+        return df
+
+    def process_positions_frame(self, positions: List[Dict[str, Any]], columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Processed positions as a DataFrame sorted by absolute PnL, optionally narrowed to columns"""
+        if not positions:
+            return pd.DataFrame(columns=columns)
+
+        df = self.build_positions_frame(positions)
 
-            processed_positions.append(processed_position)
+        # Sort by PnL (absolute value), stable so ties keep the API order
+        order = np.argsort(-np.abs(df['unrealized_pnl'].to_numpy()), kind='stable')
+        df = df.iloc[order]
 
-        # Sort by PnL (absolute value)
-        processed_positions.sort(key=lambda x: abs(x['unrealized_pnl']), reverse=True)
+        return df[columns] if columns else df
+
+    def process_positions_data(self, positions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Process positions data for display"""
+        if not positions:
+            return []
 
-        return processed_positions
+        return self.process_positions_frame(positions).to_dict('records')
 
     def process_income_data(self, income_df: pd.DataFrame) -> Dict[str, Any]:
         """Process income data for analysis"""
@@ -265,13 +313,14 @@ class DataProcessor:
 
                 # Sharpe ratio (simplified)
                 if len(returns) > 1:
-                    import numpy as np
                     returns_series = pd.Series(returns)
                     metrics['sharpe_ratio'] = (returns_series.mean() / returns_series.std()) * np.sqrt(365) if returns_series.std() > 0 else 0
 
         return metrics
 
-    def _format_symbol(self, symbol: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _format_symbol(symbol: str) -> str:
         """Format trading symbol for display"""
         if '/' not in symbol and symbol.endswith('USDT'):
             base = symbol[:-4]
@@ -2,21 +2,35 @@ import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+import numpy as np
 import pandas as pd
 from datetime import datetime, timezone
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
-from data.processor import DataProcessor
-from data.cache import get_cached_api
+from data.cache import get_cached_api, cached_process_account_summary, cached_process_positions_frame
 from binance_api.utils import format_currency, format_percentage, get_pnl_color
 
+# Processed position columns shown in the positions table, with their labels
+POSITION_DISPLAY_COLUMNS = {
+    'formatted_symbol': 'Symbol',
+    'side': 'Side',
+    'formatted_size': 'Size',
+    'formatted_entry_price': 'Entry Price',
+    'formatted_mark_price': 'Mark Price',
+    'formatted_pnl': 'P&L',
+    'formatted_percentage': 'P&L %',
+    'leverage': 'Leverage',
+    'formatted_notional': 'Notional'
+}
+
+# Only the columns the dashboard uses: the table plus the numeric PnL for the chart
+DASHBOARD_POSITION_COLUMNS = (*POSITION_DISPLAY_COLUMNS, 'unrealized_pnl')
+
 def show_dashboard():
     """Display main dashboard page"""
     st.title("📊 Binance Futures Dashboard")
     st.markdown("---")
 
-    # Initialize data processor
-    processor = DataProcessor()
     cached_api = get_cached_api()
 
     # Get client from session state
@@ -32,8 +46,8 @@ def show_dashboard():
         try:
             account_data = cached_api.cached_account_info(client)
             positions = cached_api.cached_positions(client)
-            processed_data = processor.process_account_summary(account_data)
-            processed_positions = processor.process_positions_data(positions)
+            processed_data = cached_process_account_summary(account_data)
+            positions_df = cached_process_positions_frame(positions, DASHBOARD_POSITION_COLUMNS)
         except Exception as e:
             st.error(f"❌ Error loading data: {e}")
             return
@@ -95,19 +109,12 @@ def show_dashboard():
     with col2:
         # PnL by position
         st.subheader("📈 Position P&L")
-        if processed_positions:
-            pnl_data = [(pos['formatted_symbol'], pos['unrealized_pnl'], pos['pnl_color']) for pos in processed_positions]
-            pnl_df = pd.DataFrame(pnl_data, columns=['Symbol', 'PnL', 'Color'])
-
-            fig = px.bar(
-                pnl_df,
-                x='Symbol',
-                y='PnL',
-                title='Unrealized P&L by Position',
-                color='PnL',
-                color_continuous_scale=['red', 'yellow', 'green']
+        if not positions_df.empty:
+            fig = create_pnl_chart(
+                positions_df['formatted_symbol'].to_numpy(),
+                positions_df['unrealized_pnl'].to_numpy(),
+                positions_df['formatted_pnl'].to_numpy()
             )
-            fig.update_layout(showlegend=False)
             st.plotly_chart(fig, use_container_width=True)
         else:
             st.info("No positions to display")
@@ -116,54 +123,27 @@ def show_dashboard():
 
     # Active positions table
     st.subheader("🔍 Active Positions")
-    if processed_positions:
-        # Create dataframe for positions
-        positions_df = pd.DataFrame(processed_positions)
-
+    if not positions_df.empty:
         # Format for display
-        display_columns = [
-            'formatted_symbol',
-            'side',
-            'formatted_size',
-            'formatted_entry_price',
-            'formatted_mark_price',
-            'formatted_pnl',
-            'formatted_percentage',
-            'leverage',
-            'formatted_notional'
-        ]
-
-        if display_columns[0] in positions_df.columns:
-            display_df = positions_df[display_columns].copy()
-            display_df.columns = [
-                'Symbol',
-                'Side',
-                'Size',
-                'Entry Price',
-                'Mark Price',
-                'P&L',
-                'P&L %',
-                'Leverage',
-                'Notional'
-            ]
-
-            # Add color formatting for P&L
-            st.dataframe(
-                display_df,
-                use_container_width=True,
-                hide_index=True,
-                column_config={
-                    "Symbol": st.column_config.TextColumn("Symbol"),
-                    "Side": st.column_config.TextColumn("Side"),
-                    "Size": st.column_config.TextColumn("Size"),
-                    "Entry Price": st.column_config.TextColumn("Entry Price"),
-                    "Mark Price": st.column_config.TextColumn("Mark Price"),
-                    "P&L": st.column_config.TextColumn("P&L"),
-                    "P&L %": st.column_config.TextColumn("P&L %"),
-                    "Leverage": st.column_config.TextColumn("Leverage"),
-                    "Notional": st.column_config.TextColumn("Notional")
-                }
-            )
+        display_df = positions_df[list(POSITION_DISPLAY_COLUMNS)].rename(columns=POSITION_DISPLAY_COLUMNS)
+
+        # Add color formatting for P&L
+        st.dataframe(
+            display_df,
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                "Symbol": st.column_config.TextColumn("Symbol"),
+                "Side": st.column_config.TextColumn("Side"),
+                "Size": st.column_config.TextColumn("Size"),
+                "Entry Price": st.column_config.TextColumn("Entry Price"),
+                "Mark Price": st.column_config.TextColumn("Mark Price"),
+                "P&L": st.column_config.TextColumn("P&L"),
+                "P&L %": st.column_config.TextColumn("P&L %"),
+                "Leverage": st.column_config.TextColumn("Leverage"),
+                "Notional": st.column_config.TextColumn("Notional")
+            }
+        )
     else:
         st.info("No active positions")
 
@@ -209,19 +189,17 @@ def show_dashboard():
     # Last update time
     st.caption(f"Last updated: {processed_data['update_time'].strftime('%Y-%m-%d %H:%M:%S')} UTC")
 
-def create_pnl_chart(positions_data: list):
-    """Create PnL distribution chart"""
-    if not positions_data:
+def create_pnl_chart(symbols: np.ndarray, pnl: np.ndarray, labels: Optional[np.ndarray] = None):
+    """Create PnL distribution chart from position arrays"""
+    if len(symbols) == 0:
         return go.Figure()
 
-    df = pd.DataFrame(positions_data)
-
     fig = go.Figure(data=[
         go.Bar(
-            x=df['formatted_symbol'],
-            y=df['unrealized_pnl'],
-            marker_color=['green' if pnl >= 0 else 'red' for pnl in df['unrealized_pnl']],
-            text=df['formatted_pnl'],
+            x=symbols,
+            y=pnl,
+            marker_color=np.where(pnl >= 0, 'green', 'red'),
+            text=labels,
             textposition='auto'
         )
     ])
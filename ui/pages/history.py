@@ -1,21 +1,102 @@
 import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional
 
 from data.processor import DataProcessor
-from data.cache import get_cached_api
-from binance_api.utils import format_currency, format_percentage, get_date_range_preset
+from data.cache import get_cached_api, cached_csv_bytes
+from binance_api.utils import format_currency, format_percentage, get_date_range_preset, lttb_downsample
+
+# Line charts with more points than this are downsampled with LTTB
+LTTB_THRESHOLD = 1000
+LTTB_POINTS = 500
+
+# Datetime columns are rendered by the table instead of being formatted with strftime
+TIME_COLUMN = st.column_config.DatetimeColumn("Time", format="YYYY-MM-DD HH:mm:ss")
+
+def _since(df: pd.DataFrame, cutoff_date: datetime) -> pd.DataFrame:
+    """Rows at or after cutoff_date, cut with a binary search on the time column"""
+    if 'time' not in df.columns:
+        return df
+
+    times = pd.to_datetime(df['time']).to_numpy()
+    if not (times[1:] >= times[:-1]).all():
+        # The API returns records in time order, sort once if that ever changes
+        order = np.argsort(times, kind='stable')
+        df, times = df.iloc[order], times[order]
+
+    return df.iloc[times.searchsorted(np.datetime64(cutoff_date)):]
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _filter_and_process_trades(trades_df: pd.DataFrame, symbol: Optional[str], side: str, days: int):
+    """Apply the history filters to the trades and analyze them, cached on the filter values"""
+    # Date filter first, it keeps the time order the other filters would break
+    trades_df = _since(trades_df, datetime.now() - timedelta(days=days))
+
+    # Fuse the remaining filters into one mask and index once
+    mask = np.ones(len(trades_df), dtype=bool)
+
+    # Transaction type filter
+    if side != 'All' and 'side' in trades_df.columns:
+        mask &= (trades_df['side'] == side).to_numpy(dtype=bool, na_value=False)
+
+    # Symbol filter (if not already applied in API call)
+    if symbol and 'symbol' in trades_df.columns:
+        mask &= (trades_df['symbol'] == symbol).to_numpy(dtype=bool, na_value=False)
+
+    filtered_trades = trades_df[mask]
+
+    return filtered_trades, DataProcessor().process_trades_data(filtered_trades)
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _filter_and_process_income(income_df: pd.DataFrame, days: int):
+    """Apply the date filter to the income records and analyze them, cached on the filter values"""
+    filtered_income = _since(income_df, datetime.now() - timedelta(days=days))
+
+    if filtered_income.empty:
+        return filtered_income, None
+    return filtered_income, DataProcessor().process_income_data(filtered_income)
+
+@st.cache_data(ttl=300, max_entries=32, show_spinner=False)
+def _line_chart(df: pd.DataFrame, x: str, y: str, title: str, labels: Dict[str, str]):
+    """WebGL line chart, downsampled with LTTB when the series is large"""
+    xs, ys = df[x].to_numpy(), df[y].to_numpy()
+    if len(df) > LTTB_THRESHOLD:
+        xs, ys = lttb_downsample(xs, ys, LTTB_POINTS)
+
+    fig = go.Figure(go.Scattergl(x=xs, y=ys, mode='lines'))
+    fig.update_layout(title=title, xaxis_title=labels.get(x, x), yaxis_title=labels.get(y, y))
+    return fig
+
+@st.cache_data(ttl=300, max_entries=32, show_spinner=False)
+def _top_symbols_chart(trades_by_symbol: Dict[str, Dict[str, Any]]):
+    """Bar chart of the ten most traded symbols by volume"""
+    # Rows are {symbol: {trade_count, quoteQty, commission}}, built without a transpose
+    symbol_df = pd.DataFrame.from_dict(trades_by_symbol, orient='index').rename(columns={
+        'trade_count': 'Trade Count',
+        'quoteQty': 'Volume',
+        'commission': 'Commission'
+    }).rename_axis('Symbol').reset_index()
+
+    # Select the top 10 on the volume column only, then take those rows
+    symbol_df = symbol_df.loc[symbol_df['Volume'].nlargest(10).index]
+
+    return px.bar(
+        symbol_df,
+        x='Symbol',
+        y='Volume',
+        title='Top Traded Symbols by Volume',
+        labels={'Volume': 'Volume (USDT)'}
+    )
 
 def show_history():
     """Display transaction history page"""
     st.title("📜 Transaction History")
     st.markdown("---")
 
-    # Initialize data processor
-    processor = DataProcessor()
     cached_api = get_cached_api()
 
     # Get client from session state
@@ -26,28 +107,12 @@ def show_history():
         st.info("Please configure your API credentials in the Settings page.")
         return
 
-    # Sidebar controls
+    # Sidebar controls, these drive the API fetch so they rerun the page
     st.sidebar.markdown("### 🔍 Filters & Settings")
 
-    # Date range selection
-    date_options = {
-        "Last 7 days": 7,
-        "Last 30 days": 30,
-        "Last 90 days": 90,
-        "Last 6 months": 180,
-        "Last year": 365
-    }
-
-    selected_period = st.sidebar.selectbox("Time Period", list(date_options.keys()))
-    days = date_options[selected_period]
-
     # Symbol filter (optional)
     symbol_filter = st.sidebar.text_input("Symbol Filter (optional)", placeholder="BTCUSDT")
 
-    # Transaction type filter
-    transaction_types = ['All', 'BUY', 'SELL']
-    selected_type = st.sidebar.selectbox("Transaction Type", transaction_types)
-
     # Number of records
     limit = st.sidebar.slider("Number of Records", 10, 500, 100)
 
@@ -70,26 +135,38 @@ def show_history():
             st.error(f"❌ Error loading transaction history: {e}")
             return
 
-    # Process data
-    if not trades_df.empty:
-        # Apply filters
-        filtered_trades = trades_df.copy()
+    _render_history(trades_df, income_df, symbol_filter)
+
+@st.fragment
+def _render_history(trades_df: pd.DataFrame, income_df: pd.DataFrame, symbol_filter: str):
+    """Filter and render the history; the period and type widgets rerun only this fragment"""
+    col1, col2 = st.columns(2)
 
-        # Date filter
-        cutoff_date = datetime.now() - timedelta(days=days)
-        if 'time' in filtered_trades.columns:
-            filtered_trades = filtered_trades[filtered_trades['time'] >= cutoff_date]
+    # Date range selection
+    date_options = {
+        "Last 7 days": 7,
+        "Last 30 days": 30,
+        "Last 90 days": 90,
+        "Last 6 months": 180,
+        "Last year": 365
+    }
 
-        # Transaction type filter
-        if selected_type != 'All' and 'side' in filtered_trades.columns:
-            filtered_trades = filtered_trades[filtered_trades['side'] == selected_type]
+    with col1:
+        selected_period = st.selectbox("Time Period", list(date_options.keys()))
+    days = date_options[selected_period]
 
-        # Symbol filter (if not already applied in API call)
-        if symbol_filter and 'symbol' in filtered_trades.columns:
-            filtered_trades = filtered_trades[filtered_trades['symbol'] == symbol_filter]
+    # Transaction type filter
+    transaction_types = ['All', 'BUY', 'SELL']
+    with col2:
+        selected_type = st.selectbox("Transaction Type", transaction_types)
 
-        # Process trades data
-        trades_analysis = processor.process_trades_data(filtered_trades)
+    filtered_trades = trades_df
+    filtered_income = income_df
+
+    # Process data
+    if not trades_df.empty:
+        # Apply filters and process trades data
+        filtered_trades, trades_analysis = _filter_and_process_trades(trades_df, symbol_filter, selected_type, days)
 
         # Summary metrics
         st.markdown("### 📊 Trading Summary")
@@ -134,7 +211,7 @@ def show_history():
                 daily_df = trades_analysis['trades_by_day'].reset_index()
                 daily_df['date'] = pd.to_datetime(daily_df['date'])
 
-                fig = px.line(
+                fig = _line_chart(
                     daily_df,
                     x='date',
                     y='quoteQty',
@@ -148,57 +225,26 @@ def show_history():
         with col2:
             st.subheader("🏆 Most Traded Symbols")
             if trades_analysis['trades_by_symbol']:
-                symbol_df = pd.DataFrame(trades_analysis['trades_by_symbol']).T.reset_index()
-                symbol_df.columns = ['Symbol', 'Trade Count', 'Volume', 'Commission']
-
-                # Sort by volume and take top 10
-                symbol_df = symbol_df.nlargest(10, 'Volume')
-
-                fig = px.bar(
-                    symbol_df,
-                    x='Symbol',
-                    y='Volume',
-                    title='Top Traded Symbols by Volume',
-                    labels={'Volume': 'Volume (USDT)'}
-                )
+                fig = _top_symbols_chart(trades_analysis['trades_by_symbol'])
                 st.plotly_chart(fig, use_container_width=True)
             else:
                 st.info("No symbol trading data available")
 
+        # Volume and P&L per symbol
+        if not filtered_trades.empty:
+            st.plotly_chart(create_symbol_performance_chart(filtered_trades), use_container_width=True)
+
         st.markdown("---")
 
         # Detailed transactions table
         st.subheader("📋 Transaction History")
 
         if not filtered_trades.empty:
-            # Prepare display data
-            display_df = filtered_trades.copy()
-
-            # Format columns for display
-            if 'price' in display_df.columns:
-                display_df['price'] = display_df['price'].round(4)
-
-            if 'qty' in display_df.columns:
-                display_df['qty'] = display_df['qty'].round(4)
-
-            if 'quoteQty' in display_df.columns:
-                display_df['quoteQty'] = display_df['quoteQty'].round(2)
-
-            if 'commission' in display_df.columns:
-                display_df['commission'] = display_df['commission'].round(4)
-
-            if 'realized_pnl' in display_df.columns:
-                display_df['realized_pnl'] = display_df['realized_pnl'].round(2)
-
-            # Select and rename columns for display
-            if 'time' in display_df.columns:
-                display_df['time'] = pd.to_datetime(display_df['time']).dt.strftime('%Y-%m-%d %H:%M:%S')
-
+            # Select and rename columns for display, numbers and time are formatted by the table
             display_columns = ['time', 'symbol', 'side', 'qty', 'price', 'quoteQty', 'commission', 'realized_pnl']
-            available_columns = [col for col in display_columns if col in display_df.columns]
+            available_columns = [col for col in display_columns if col in filtered_trades.columns]
 
             if available_columns:
-                display_data = display_df[available_columns].copy()
                 column_mapping = {
                     'time': 'Time',
                     'symbol': 'Symbol',
@@ -210,13 +256,21 @@ def show_history():
                     'realized_pnl': 'Realized P&L'
                 }
 
-                display_data.columns = [column_mapping.get(col, col) for col in display_data.columns]
+                display_data = filtered_trades[available_columns].rename(columns=column_mapping)
 
                 st.dataframe(
                     display_data,
                     use_container_width=True,
                     hide_index=True,
-                    height=400
+                    height=400,
+                    column_config={
+                        "Time": TIME_COLUMN,
+                        "Quantity": st.column_config.NumberColumn("Quantity", format="%.4f"),
+                        "Price": st.column_config.NumberColumn("Price", format="%.4f"),
+                        "Total": st.column_config.NumberColumn("Total", format="%.2f"),
+                        "Commission": st.column_config.NumberColumn("Commission", format="%.4f"),
+                        "Realized P&L": st.column_config.NumberColumn("Realized P&L", format="%.2f")
+                    }
                 )
         else:
             st.info("No transactions match the current filters")
@@ -229,17 +283,10 @@ def show_history():
         st.markdown("---")
         st.subheader("💰 Income & Fees History")
 
-        # Apply date filter
-        filtered_income = income_df.copy()
-        cutoff_date = datetime.now() - timedelta(days=days)
-        if 'time' in filtered_income.columns:
-            filtered_income['time'] = pd.to_datetime(filtered_income['time'])
-            filtered_income = filtered_income[filtered_income['time'] >= cutoff_date]
+        # Apply date filter and process income data
+        filtered_income, income_analysis = _filter_and_process_income(income_df, days)
 
         if not filtered_income.empty:
-            # Process income data
-            income_analysis = processor.process_income_data(filtered_income)
-
             col1, col2 = st.columns(2)
 
             with col1:
@@ -261,7 +308,7 @@ def show_history():
                     daily_income_df = income_analysis['income_by_day'].reset_index()
                     daily_income_df['date'] = pd.to_datetime(daily_income_df['date'])
 
-                    fig = px.line(
+                    fig = _line_chart(
                         daily_income_df,
                         x='date',
                         y='income',
@@ -273,27 +320,26 @@ def show_history():
             # Recent income table
             if not income_analysis['recent_income'].empty:
                 st.subheader("Recent Income Records")
-                recent_income_df = income_analysis['recent_income'].copy()
-
-                # Format for display
-                if 'time' in recent_income_df.columns:
-                    recent_income_df['time'] = pd.to_datetime(recent_income_df['time']).dt.strftime('%Y-%m-%d %H:%M:%S')
-
-                if 'income' in recent_income_df.columns:
-                    recent_income_df['income'] = recent_income_df['income'].round(4)
+                recent_income_df = income_analysis['recent_income']
 
                 display_columns = ['time', 'symbol', 'incomeType', 'income', 'asset']
                 available_columns = [col for col in display_columns if col in recent_income_df.columns]
 
                 if available_columns:
-                    display_data = recent_income_df[available_columns].copy()
-                    display_data.columns = [col.replace('incomeType', 'Type').replace('income', 'Income').title() for col in display_data.columns]
+                    display_data = recent_income_df[available_columns].set_axis(
+                        [col.replace('incomeType', 'Type').replace('income', 'Income').title() for col in available_columns],
+                        axis=1
+                    )
 
                     st.dataframe(
                         display_data,
                         use_container_width=True,
                         hide_index=True,
-                        height=300
+                        height=300,
+                        column_config={
+                            "Time": TIME_COLUMN,
+                            "Income": st.column_config.NumberColumn("Income", format="%.4f")
+                        }
                     )
 
     # Export functionality
@@ -302,7 +348,7 @@ def show_history():
 
     with col1:
         if not filtered_trades.empty and st.button("📥 Export Trades Data"):
-            csv = filtered_trades.to_csv(index=False)
+            csv = cached_csv_bytes(filtered_trades)
             st.download_button(
                 label="Download Trades CSV",
                 data=csv,
@@ -312,7 +358,7 @@ def show_history():
 
     with col2:
         if not filtered_income.empty and st.button("📥 Export Income Data"):
-            csv = filtered_income.to_csv(index=False)
+            csv = cached_csv_bytes(filtered_income)
             st.download_button(
                 label="Download Income CSV",
                 data=csv,
@@ -320,40 +366,21 @@ def show_history():
                 mime="text/csv"
             )
 
-def create_trade_volume_chart(trades_df: pd.DataFrame):
-    """Create trade volume chart over time"""
-    if trades_df.empty:
-        return go.Figure()
-
-    # Group by date
-    trades_df['date'] = pd.to_datetime(trades_df['time']).dt.date
-    daily_volume = trades_df.groupby('date')['quoteQty'].sum().reset_index()
-    daily_volume['date'] = pd.to_datetime(daily_volume['date'])
-
-    fig = px.line(
-        daily_volume,
-        x='date',
-        y='quoteQty',
-        title='Daily Trading Volume',
-        labels={'quoteQty': 'Volume (USDT)', 'date': 'Date'}
-    )
-
-    return fig
-
 def create_symbol_performance_chart(trades_df: pd.DataFrame):
     """Create symbol performance chart"""
     if trades_df.empty:
         return go.Figure()
 
-    # Group by symbol
-    symbol_stats = trades_df.groupby('symbol').agg({
+    # Group by symbol on categorical codes, unsorted since the top 15 are picked below
+    symbol = trades_df['symbol'].astype('category')
+    symbol_stats = trades_df.groupby(symbol, sort=False, observed=True).agg({
         'quoteQty': 'sum',
         'commission': 'sum',
         'realized_pnl': 'sum'
     }).reset_index()
 
-    # Sort by volume
-    symbol_stats = symbol_stats.nlargest(15, 'quoteQty')
+    # Top 15 by volume, selected on the one column
+    symbol_stats = symbol_stats.loc[symbol_stats['quoteQty'].nlargest(15).index]
 
     fig = go.Figure()
 
@@ -368,11 +395,12 @@ def create_symbol_performance_chart(trades_df: pd.DataFrame):
         name='P&L',
         x=symbol_stats['symbol'],
         y=symbol_stats['realized_pnl'],
-        marker_color=['green' if pnl >= 0 else 'red' for pnl in symbol_stats['realized_pnl']]
+        marker_color=np.where(symbol_stats['realized_pnl'].to_numpy() >= 0, 'green', 'red').tolist()
     ))
 
     fig.update_layout(
         title='Symbol Performance',
+        template='plotly_white',
         xaxis_title='Symbol',
         yaxis_title='USDT',
         barmode='group'
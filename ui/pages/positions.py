@@ -1,21 +1,19 @@
 import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from typing import Dict, Any
 
-from data.processor import DataProcessor
-from data.cache import get_cached_api
-from binance_api.utils import format_currency, format_percentage, get_leverage_risk_score, calculate_position_size_risk
+from data.cache import get_cached_api, cached_csv_bytes, cached_process_positions_frame
+from binance_api.utils import format_currency, format_percentage, position_risk_frame
 
 def show_positions():
     """Display positions page"""
     st.title("🔍 Positions Management")
     st.markdown("---")
 
-    # Initialize data processor
-    processor = DataProcessor()
     cached_api = get_cached_api()
 
     # Get client from session state
@@ -30,56 +28,71 @@ def show_positions():
     with st.spinner("Loading positions data..."):
         try:
             positions = cached_api.cached_positions(client)
-            processed_positions = processor.process_positions_data(positions)
+            all_positions_df = cached_process_positions_frame(positions)
         except Exception as e:
             st.error(f"❌ Error loading positions: {e}")
             return
 
-    if not processed_positions:
+    if all_positions_df.empty:
         st.info("No active positions found")
         return
 
-    # Filters sidebar
-    st.sidebar.markdown("### 🔧 Filters")
+    _render_positions(all_positions_df)
+
+@st.fragment
+def _render_positions(all_positions_df: pd.DataFrame):
+    """Filter and render the positions; the filter widgets rerun only this fragment"""
+    # Filters
+    st.markdown("### 🔧 Filters")
+    col1, col2, col3 = st.columns(3)
 
     # Filter by side
     sides = ['All', 'LONG', 'SHORT']
-    selected_side = st.sidebar.selectbox("Filter by Side", sides)
+    with col1:
+        selected_side = st.selectbox("Filter by Side", sides)
 
     # Filter by PnL
-    pnl_filter = st.sidebar.selectbox("Filter by P&L", ['All', 'Profitable', 'Losing'])
+    with col2:
+        pnl_filter = st.selectbox("Filter by P&L", ['All', 'Profitable', 'Losing'])
 
     # Leverage filter
-    leverage_threshold = st.sidebar.slider("Minimum Leverage", 1, 50, 1)
-
-    # Apply filters
-    filtered_positions = []
-    for pos in processed_positions:
-        # Side filter
-        if selected_side != 'All' and pos['side'] != selected_side:
-            continue
+    with col3:
+        leverage_threshold = st.slider("Minimum Leverage", 1, 50, 1)
 
-        # PnL filter
-        if pnl_filter == 'Profitable' and pos['unrealized_pnl'] <= 0:
-            continue
-        elif pnl_filter == 'Losing' and pos['unrealized_pnl'] > 0:
-            continue
+    # Apply filters as one boolean mask
+    mask = all_positions_df['leverage'] >= leverage_threshold
+    if selected_side != 'All':
+        mask &= all_positions_df['side'] == selected_side
+    if pnl_filter == 'Profitable':
+        mask &= all_positions_df['unrealized_pnl'] > 0
+    elif pnl_filter == 'Losing':
+        mask &= all_positions_df['unrealized_pnl'] <= 0
 
-        # Leverage filter
-        if pos['leverage'] < leverage_threshold:
-            continue
+    # Reused by the metrics, charts, table and export below
+    positions_df = all_positions_df[mask]
 
-        filtered_positions.append(pos)
+    st.markdown("---")
 
     # Summary metrics
     st.markdown("### 📊 Position Summary")
     col1, col2, col3, col4 = st.columns(4)
 
-    total_notional = sum(pos['notional'] for pos in filtered_positions)
-    total_pnl = sum(pos['unrealized_pnl'] for pos in filtered_positions)
-    long_positions = sum(1 for pos in filtered_positions if pos['side'] == 'LONG')
-    short_positions = sum(1 for pos in filtered_positions if pos['side'] == 'SHORT')
-    avg_leverage = sum(pos['leverage'] for pos in filtered_positions) / len(filtered_positions) if filtered_positions else 0
+    if not positions_df.empty:
+        totals = positions_df[['notional', 'unrealized_pnl', 'leverage']].agg({
+            'notional': 'sum',
+            'unrealized_pnl': 'sum',
+            'leverage': 'mean'
+        })
+        side_counts = positions_df['side'].value_counts()
+    else:
+        totals = pd.Series({'notional': 0.0, 'unrealized_pnl': 0.0, 'leverage': 0.0})
+        side_counts = pd.Series(dtype='int64')
+
+    total_notional = totals['notional']
+    total_pnl = totals['unrealized_pnl']
+    long_positions = int(side_counts.get('LONG', 0))
+    short_positions = int(side_counts.get('SHORT', 0))
+    avg_leverage = totals['leverage']
 
     with col1:
         st.metric("Total Notional", format_currency(total_notional))
@@ -97,10 +110,9 @@ def show_positions():
 
     with col1:
         st.subheader("📈 P&L Distribution")
-        if filtered_positions:
-            pnl_df = pd.DataFrame(filtered_positions)
+        if not positions_df.empty:
             fig = px.bar(
-                pnl_df,
+                positions_df,
                 x='formatted_symbol',
                 y='unrealized_pnl',
                 color='unrealized_pnl',
@@ -114,9 +126,10 @@ def show_positions():
 
     with col2:
         st.subheader("⚖️ Long vs Short Exposure")
-        if filtered_positions:
-            long_exposure = sum(pos['notional'] for pos in filtered_positions if pos['side'] == 'LONG')
-            short_exposure = sum(pos['notional'] for pos in filtered_positions if pos['side'] == 'SHORT')
+        if not positions_df.empty:
+            side_exposure = positions_df.groupby('side')['notional'].sum()
+            long_exposure = side_exposure.get('LONG', 0)
+            short_exposure = side_exposure.get('SHORT', 0)
 
             fig = go.Figure(data=[
                 go.Bar(name='Long', x=['Exposure'], y=[long_exposure], marker_color='green'),
@@ -131,36 +144,41 @@ def show_positions():
         else:
             st.info("No positions match the filters")
 
+    # Per-position breakdown
+    if not positions_df.empty:
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.plotly_chart(create_leverage_chart(positions_df), use_container_width=True)
+
+        with col2:
+            st.plotly_chart(create_exposure_chart(positions_df), use_container_width=True)
+
     st.markdown("---")
 
     # Risk Analysis
     st.subheader("⚠️ Risk Analysis")
 
-    if filtered_positions:
-        # Calculate risk metrics for each position
-        risk_data = []
-        for pos in filtered_positions:
-            position_risk = calculate_position_size_risk(pos)
-            leverage_risk = get_leverage_risk_score(pos['leverage'])
-
-            risk_data.append({
-                'Symbol': pos['symbol'],
-                'Side': pos['side'],
-                'Size Risk': position_risk['size_risk'],
-                'Leverage Risk': leverage_risk['level'],
-                'Total Risk Score': position_risk['total_risk_score']
-            })
-
-        risk_df = pd.DataFrame(risk_data)
+    if not positions_df.empty:
+        # Calculate risk metrics for all positions at once
+        risk = position_risk_frame(positions_df['notional'], positions_df['leverage'])
+        risk_df = pd.DataFrame({
+            'Symbol': positions_df['symbol'],
+            'Side': positions_df['side'],
+            'Size Risk': risk['size_risk'],
+            'Leverage Risk': risk['leverage_risk'],
+            'Total Risk Score': risk['total_risk_score']
+        })
 
         col1, col2 = st.columns(2)
 
         with col1:
-            # Risk distribution
-            risk_counts = risk_df['Total Risk Score'].value_counts().sort_index()
+            # Risk distribution, scores are small integers (max 8) so count them with bincount
+            risk_counts = np.bincount(risk_df['Total Risk Score'].to_numpy(dtype=np.int64), minlength=9)
+            scores = np.flatnonzero(risk_counts)
             fig = px.bar(
-                x=risk_counts.index,
-                y=risk_counts.values,
+                x=scores,
+                y=risk_counts[scores],
                 title='Risk Score Distribution',
                 labels={'x': 'Risk Score', 'y': 'Number of Positions'}
             )
@@ -192,10 +210,7 @@ def show_positions():
     # Detailed positions table
     st.subheader("📋 Detailed Positions")
 
-    if filtered_positions:
-        # Create dataframe for display
-        positions_df = pd.DataFrame(filtered_positions)
-
+    if not positions_df.empty:
         # Select columns for display
         display_columns = [
             'formatted_symbol',
@@ -211,8 +226,7 @@ def show_positions():
         ]
 
         if all(col in positions_df.columns for col in display_columns):
-            display_df = positions_df[display_columns].copy()
-            display_df.columns = [
+            display_df = positions_df[display_columns].set_axis([
                 'Symbol',
                 'Side',
                 'Size',
@@ -223,7 +237,7 @@ def show_positions():
                 'Leverage',
                 'Notional',
                 'Margin Type'
-            ]
+            ], axis=1)
 
             # Add color based on P&L
             st.dataframe(
@@ -249,9 +263,8 @@ def show_positions():
     # Export functionality
     st.markdown("---")
     if st.button("📥 Export Positions Data"):
-        if filtered_positions:
-            export_df = pd.DataFrame(filtered_positions)
-            csv = export_df.to_csv(index=False)
+        if not positions_df.empty:
+            csv = cached_csv_bytes(positions_df)
             st.download_button(
                 label="Download CSV",
                 data=csv,
@@ -259,13 +272,11 @@ def show_positions():
                 mime="text/csv"
             )
 
-def create_leverage_chart(positions_data: list):
+def create_leverage_chart(df: pd.DataFrame):
     """Create leverage distribution chart"""
-    if not positions_data:
+    if df.empty:
         return go.Figure()
 
-    df = pd.DataFrame(positions_data)
-
     fig = go.Figure(data=[
         go.Bar(
             x=df['formatted_symbol'],
@@ -284,13 +295,11 @@ def create_leverage_chart(positions_data: list):
 
     return fig
 
-def create_exposure_chart(positions_data: list):
+def create_exposure_chart(df: pd.DataFrame):
     """Create exposure distribution chart"""
-    if not positions_data:
+    if df.empty:
         return go.Figure()
 
-    df = pd.DataFrame(positions_data)
-
     # Group by side
     long_df = df[df['side'] == 'LONG']
     short_df = df[df['side'] == 'SHORT']
@@ -0,0 +1,3 @@
+"""Settings page, one module per section"""
+
+from ui.pages.settings.page import show_settings
@@ -0,0 +1,155 @@
+import hashlib
+import streamlit as st
+from typing import Dict, Any, Optional, Tuple
+
+from config.secrets import SecretsManager
+from binance_api.client import BinanceClient, script_context_executor
+from ui.pages.settings.page import SettingsView, HELP, settings_form, submit_settings_button
+
+# Repeated Test Connection clicks within this window reuse the last ping
+CONNECTION_TEST_TTL = 10  # seconds
+
+def _credentials_hash(api_key: str, secret_key: str) -> str:
+    """Fingerprint credentials for cache keys without exposing them"""
+    return hashlib.sha256(f"{api_key}:{secret_key}".encode()).hexdigest()[:16]
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _get_test_client(credentials_hash: str, use_testnet: bool, timeout: int, _config: Dict[str, Any]) -> BinanceClient:
+    """Build the connection test client once per credentials and network"""
+    # Reusing the client keeps its pooled session, so repeated tests skip the TLS handshake
+    return BinanceClient(_config)
+
+@st.cache_data(ttl=CONNECTION_TEST_TTL, show_spinner=False, max_entries=4)
+def _cached_ping(credentials_hash: str, use_testnet: bool, _client: BinanceClient) -> bool:
+    """Reuse a recent ping result for the same credentials and network"""
+    return _client.test_connection()
+
+def _run_connection_test(client: BinanceClient, credentials_hash: str, use_testnet: bool) -> Tuple[bool, Optional[float], Optional[Exception]]:
+    """Ping the API and fetch the account balance concurrently"""
+    executor = script_context_executor(max_workers=2)
+    try:
+        ping = executor.submit(_cached_ping, credentials_hash, use_testnet, client)
+        # Account data is already memoized by the client, only the ping needs its own cache
+        account = executor.submit(client.get_account_info)
+        if not ping.result():
+            return False, None, None
+
+        # The ping is unauthenticated, so the account call can fail on its own
+        account_error = account.exception()
+        if account_error is not None:
+            return True, None, account_error
+        return True, account.result().get('total_balance', 0), None
+    finally:
+        # Don't hold a failed test on the account call, the session timeout bounds it
+        executor.shutdown(wait=False)
+
+def render(config: Dict[str, Any], view: SettingsView):
+    """Render API credentials, connection test and environment settings"""
+    # API Credentials
+    st.markdown("### 🔑 Binance API Configuration\n\n#### API Credentials")
+
+    # Current credentials status
+    api_key, secret_key = SecretsManager.get_credentials()
+
+    if api_key and secret_key:
+        st.success("✅ API credentials are configured")
+    else:
+        st.warning("⚠️ API credentials not found")
+
+    # Manual credential input
+    _credentials_fragment()
+
+    # Test connection
+    _test_connection_fragment(config, view)
+
+    with settings_form("api"):
+        # Environment setup
+        st.markdown("#### Environment Setup")
+        st.checkbox(
+            "🧪 Use Testnet",
+            key="settings_use_testnet",
+            help=HELP["use_testnet"]
+        )
+
+        st.number_input(
+            "⏱️ API Timeout (seconds)",
+            min_value=5,
+            max_value=120,
+            key="settings_api_timeout",
+            help=HELP["api_timeout"]
+        )
+
+        submit_settings_button(config)
+
+@st.fragment
+def _credentials_fragment():
+    """Credential inputs, typing and clicks rerun only this fragment"""
+    with st.expander("🔧 Configure API Credentials"):
+        st.markdown("**Note:** Credentials are stored temporarily in session state for security.")
+
+        manual_api_key = st.text_input(
+            "API Key",
+            value="",
+            type="password",
+            help=HELP["api_key"]
+        )
+
+        manual_secret_key = st.text_input(
+            "Secret Key",
+            value="",
+            type="password",
+            help=HELP["secret_key"]
+        )
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            if st.button("💾 Save Credentials", type="primary"):
+                if manual_api_key and manual_secret_key:
+                    if SecretsManager.validate_credentials(manual_api_key, manual_secret_key):
+                        SecretsManager.store_temp_credentials(manual_api_key, manual_secret_key)
+                        st.success("✅ Credentials saved successfully!")
+                        st.rerun()
+                    else:
+                        st.error("❌ Invalid credentials format")
+                else:
+                    st.error("❌ Please enter both API key and secret key")
+
+        with col2:
+            if st.button("🗑️ Clear Credentials"):
+                SecretsManager.clear_temp_credentials()
+                st.success("✅ Credentials cleared!")
+                st.rerun()
+
+@st.fragment
+def _test_connection_fragment(config: Dict[str, Any], view: SettingsView):
+    """Connection test button, rerun without rebuilding the page"""
+    st.markdown("#### Test API Connection")
+    if st.button("🔗 Test Connection"):
+        with st.spinner("Testing connection..."):
+            try:
+                # Get temporary credentials if available
+                temp_key, temp_secret = SecretsManager.get_temp_credentials()
+                if temp_key and temp_secret:
+                    test_config = config.copy()
+                    test_config['binance'] = {**config['binance'], 'api_key': temp_key, 'secret_key': temp_secret}
+
+                    credentials_hash = _credentials_hash(temp_key, temp_secret)
+                    test_client = _get_test_client(credentials_hash, view.use_testnet, view.timeout, test_config)
+                    connected, total_balance, account_error = _run_connection_test(
+                        test_client, credentials_hash, view.use_testnet
+                    )
+                    if connected:
+                        st.success("✅ Connection successful!")
+                        # Show account info preview
+                        if account_error is None:
+                            st.info(f"Connected! Total balance: ${total_balance:,.2f}")
+                        else:
+                            st.error(f"❌ Could not load account info: {account_error}")
+                    else:
+                        st.error("❌ Connection failed")
+                else:
+                    st.error("❌ No credentials configured")
+
+            except Exception as e:
+                st.error(f"❌ Connection error: {e}")
@@ -0,0 +1,63 @@
+import streamlit as st
+from typing import Dict, Any
+
+from ui.pages.settings.page import SettingsView, HELP, settings_form, submit_settings_button
+
+def render(config: Dict[str, Any], view: SettingsView):
+    """Render performance, data display and risk settings"""
+    with settings_form("app"):
+        # Performance settings
+        st.markdown("### 📊 Application Settings\n\n#### Performance Settings")
+        st.checkbox(
+            "💾 Enable Data Caching",
+            key="settings_enable_cache",
+            help=HELP["enable_cache"]
+        )
+
+        st.number_input(
+            "⏰ Cache Timeout (seconds)",
+            min_value=30,
+            max_value=600,
+            key="settings_cache_timeout",
+            help=HELP["cache_timeout"]
+        )
+
+        # Data display settings
+        st.markdown("#### Data Display Settings")
+        st.number_input(
+            "📋 Maximum Records to Display",
+            min_value=10,
+            max_value=1000,
+            step=10,
+            key="settings_max_records",
+            help=HELP["max_records"]
+        )
+
+        st.number_input(
+            "🔢 Decimal Places",
+            min_value=2,
+            max_value=8,
+            key="settings_decimal_places",
+            help=HELP["decimal_places"]
+        )
+
+        # Risk settings
+        st.markdown("#### Risk Management")
+        st.number_input(
+            "⚠️ High Leverage Warning Threshold",
+            min_value=2,
+            max_value=50,
+            key="settings_leverage_warning",
+            help=HELP["leverage_warning"]
+        )
+
+        st.number_input(
+            "💸 Large Position Warning (USDT)",
+            min_value=1000,
+            max_value=100000,
+            step=1000,
+            key="settings_position_size_warning",
+            help=HELP["position_size_warning"]
+        )
+
+        submit_settings_button(config)
@@ -0,0 +1,54 @@
+import streamlit as st
+from typing import Dict, Any
+
+from ui.pages.settings.page import (
+    SettingsView, HELP, settings_form, submit_settings_button, THEME_OPTIONS, CURRENCY_OPTIONS, TIMEZONE_OPTIONS, DATE_FORMAT_OPTIONS
+)
+
+def render(config: Dict[str, Any], view: SettingsView):
+    """Render theme, currency and date/time settings"""
+    with settings_form("display"):
+        # Theme settings
+        st.markdown("### 🎨 Display Settings\n\n#### Theme Configuration")
+        st.selectbox(
+            "🎨 Color Theme",
+            THEME_OPTIONS,
+            key="settings_theme",
+            help=HELP["theme"]
+        )
+
+        # Currency settings
+        st.markdown("#### Currency Settings")
+        st.selectbox(
+            "💱 Default Currency",
+            CURRENCY_OPTIONS,
+            key="settings_default_currency",
+            help=HELP["default_currency"]
+        )
+
+        # Date/Time settings
+        st.markdown("#### Date & Time Settings")
+        st.selectbox(
+            "🌍 Timezone",
+            TIMEZONE_OPTIONS,
+            key="settings_timezone",
+            help=HELP["timezone"]
+        )
+
+        st.selectbox(
+            "📅 Date Format",
+            DATE_FORMAT_OPTIONS,
+            key="settings_date_format",
+            help=HELP["date_format"]
+        )
+
+        # Refresh settings
+        st.number_input(
+            "🔄 Refresh Interval (seconds)",
+            min_value=10,
+            max_value=300,
+            key="settings_refresh_interval",
+            help=HELP["refresh_interval"]
+        )
+
+        submit_settings_button(config)
@@ -0,0 +1,51 @@
+import streamlit as st
+from typing import Dict, Any
+
+from ui.pages.settings.page import SettingsView
+
+# Static System Info content, built once at import
+PACKAGE_INFO = """
+**Binance Futures Dashboard**
+Version: 1.0.0
+Framework: Streamlit
+API: Binance Futures API
+
+**Dependencies:**
+- streamlit>=1.37.0
+- python-binance>=1.0.19
+- pandas>=2.0.0
+- plotly>=5.15.0
+"""
+
+# use_testnet -> endpoint shown
+API_ENDPOINTS = {
+    True: "Binance Futures Testnet: https://testnet.binancefuture.com",
+    False: "Binance Futures: https://fapi.binance.com"
+}
+
+CONFIG_FILES_MD = "#### 📁 Configuration Files\n\n" + "\n".join(f"• {file_info}  " for file_info in (
+    "config.toml - Main configuration",
+    ".env - Environment variables",
+    "requirements.txt - Python dependencies"
+))
+
+SECURITY_NOTES = """
+• API credentials are stored temporarily in session state
+• Never share your API keys or secrets
+• Use API keys with limited permissions when possible
+• Consider using IP whitelist for your API keys
+• Enable testnet mode for development and testing
+"""
+
+def render(config: Dict[str, Any], view: SettingsView):
+    """Render package, endpoint and security information"""
+    st.markdown("### ℹ️ System Information\n\n#### 📦 Package Information")
+    st.info(PACKAGE_INFO)
+
+    st.markdown("#### 🔗 API Endpoints")
+    st.code(API_ENDPOINTS[bool(st.session_state['settings_use_testnet'])])
+
+    st.markdown(CONFIG_FILES_MD)
+
+    st.markdown("#### 🛡️ Security Notes")
+    st.warning(SECURITY_NOTES)
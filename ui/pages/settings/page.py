@@ -0,0 +1,179 @@
+import json
+import hashlib
+import importlib
+import streamlit as st
+from dataclasses import dataclass
+from typing import Dict, Any
+
+from config.settings import load_config, load_safe_config, save_config, scrub_config, get_config_mtime
+
+# Section label -> module rendering it
+SETTINGS_SECTIONS = {
+    "🔑 API Configuration": "_api",
+    "🎨 Display Settings": "_display",
+    "📊 App Settings": "_app",
+    "ℹ️ System Info": "_info"
+}
+
+THEME_OPTIONS = ("dark", "light")
+CURRENCY_OPTIONS = ("USDT", "BUSD", "BTC")
+TIMEZONE_OPTIONS = ("UTC", "America/New_York", "Europe/London", "Asia/Tokyo", "Asia/Shanghai")
+DATE_FORMAT_OPTIONS = ("%Y-%m-%d %H:%M:%S", "%m/%d/%Y %I:%M:%S %p", "%d/%m/%Y %H:%M:%S")
+
+# Widget tooltips, shared by the section modules
+HELP = {
+    "use_testnet": "Use Binance Testnet for testing (requires separate testnet API keys)",
+    "api_timeout": "Timeout for API requests",
+    "api_key": "Your Binance Futures API Key",
+    "secret_key": "Your Binance Futures Secret Key",
+    "enable_cache": "Cache API responses to reduce rate limiting",
+    "cache_timeout": "How long to keep cached data",
+    "max_records": "Maximum number of records to show in tables",
+    "decimal_places": "Number of decimal places to display for prices",
+    "leverage_warning": "Show warning when leverage exceeds this value",
+    "position_size_warning": "Show warning when position size exceeds this amount",
+    "theme": "Choose application theme",
+    "default_currency": "Default currency for displaying values",
+    "timezone": "Timezone for displaying timestamps",
+    "date_format": "Format for displaying dates and times",
+    "refresh_interval": "How often to refresh data from API"
+}
+
+# Widget key -> (config section, option) written by the Save button
+CONFIG_WIDGETS = {
+    'settings_use_testnet': ('binance', 'use_testnet'),
+    'settings_api_timeout': ('binance', 'timeout'),
+    'settings_theme': ('app', 'theme'),
+    'settings_refresh_interval': ('app', 'refresh_interval'),
+    'settings_default_currency': ('display', 'default_currency'),
+    'settings_timezone': ('display', 'timezone'),
+    'settings_date_format': ('display', 'date_format')
+}
+
+# Selectbox widget key -> its options, the first one is the fallback
+SELECT_OPTIONS = {
+    'settings_theme': THEME_OPTIONS,
+    'settings_default_currency': CURRENCY_OPTIONS,
+    'settings_timezone': TIMEZONE_OPTIONS,
+    'settings_date_format': DATE_FORMAT_OPTIONS
+}
+
+# Widgets that are not persisted to config.toml, with their initial values
+LOCAL_WIDGET_DEFAULTS = {
+    'settings_enable_cache': True,
+    'settings_cache_timeout': 60,
+    'settings_max_records': 100,
+    'settings_decimal_places': 4,
+    'settings_leverage_warning': 10,
+    'settings_position_size_warning': 10000
+}
+
+@dataclass(slots=True, frozen=True)
+class SettingsView:
+    """Editable settings flattened out of the nested config"""
+    use_testnet: bool
+    timeout: int
+    theme: str
+    refresh_interval: int
+    default_currency: str
+    timezone: str
+    date_format: str
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'SettingsView':
+        """Create a SettingsView from the merged configuration"""
+        binance, app, display = config['binance'], config['app'], config['display']
+        return cls(
+            use_testnet=binance['use_testnet'],
+            timeout=binance['timeout'],
+            theme=app['theme'],
+            refresh_interval=app['refresh_interval'],
+            default_currency=display['default_currency'],
+            timezone=display['timezone'],
+            date_format=display['date_format']
+        )
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _config_preview_json(config_mtime: float) -> str:
+    """Serialize the credential-free config once per config.toml revision"""
+    return json.dumps(load_safe_config(), indent=2)
+
+def _config_signature(config: Dict[str, Any]) -> bytes:
+    """Fingerprint a credential-free config for cheap change detection"""
+    payload = json.dumps(config, sort_keys=True, separators=(',', ':'))
+    return hashlib.blake2b(payload.encode(), digest_size=16).digest()
+
+def _sync_widget_state(view: SettingsView, config_mtime: float):
+    """Seed settings widgets from config and keep their values while hidden"""
+    # Re-seed whenever config.toml changed since the last seeding (hand edit or
+    # another session's save), so stale values are never written back over it
+    reseed = st.session_state.get('_settings_seed_mtime') != config_mtime
+    st.session_state['_settings_seed_mtime'] = config_mtime
+
+    # Streamlit drops the state of widgets that are not rendered in a run, so
+    # values of the inactive sections are re-assigned to survive until Save
+    for key, (_, option) in CONFIG_WIDGETS.items():
+        if reseed or key not in st.session_state:
+            value = getattr(view, option)
+            options = SELECT_OPTIONS.get(key)
+            # A value edited into config.toml may not be offered by its selectbox
+            if options is not None and value not in options:
+                value = options[0]
+            st.session_state[key] = value
+        else:
+            st.session_state[key] = st.session_state[key]
+    for key, value in LOCAL_WIDGET_DEFAULTS.items():
+        st.session_state[key] = st.session_state.get(key, value)
+
+def settings_form(section: str):
+    """Form batching a section's inputs, so edits only rerun the page on submit"""
+    return st.form(f"settings_{section}_form", border=False)
+
+def submit_settings_button(config: Dict[str, Any]):
+    """Save Settings submit button, to be placed inside a settings form"""
+    if st.form_submit_button("💾 Save Settings", type="primary"):
+        _save_settings(config)
+
+def _save_settings(config: Dict[str, Any]):
+    """Write the submitted settings to config.toml if they changed"""
+    # Update config with the values of every section, rendered or not;
+    # sections are copied so the loaded config stays the baseline
+    updated_config = {section: dict(values) for section, values in config.items()}
+    for key, (section, option) in CONFIG_WIDGETS.items():
+        updated_config[section][option] = st.session_state[key]
+
+    if _config_signature(scrub_config(updated_config)) == _config_signature(load_safe_config()):
+        st.info("ℹ️ No changes to save")
+    elif save_config(updated_config):
+        _config_preview_json.clear()
+        st.success("✅ Settings saved successfully!")
+        st.rerun()
+    else:
+        st.error("❌ Failed to save settings")
+
+def show_settings():
+    """Display settings page"""
+    st.title("⚙️ Settings & Configuration")
+    st.markdown("---")
+
+    # Load current config; mtime first, so a concurrent write only causes an extra re-seed
+    config_mtime = get_config_mtime()
+    config = load_config()
+    view = SettingsView.from_config(config)
+    _sync_widget_state(view, config_mtime)
+
+    # Only the selected section is built; st.tabs would run every tab body on each rerun
+    active_section = st.radio("Section", tuple(SETTINGS_SECTIONS), horizontal=True, key="settings_tab", label_visibility="collapsed")
+
+    # Section renderers live in their own modules and are imported on first use
+    section = importlib.import_module(f"ui.pages.settings.{SETTINGS_SECTIONS[active_section]}")
+    section.render(config, view)
+
+    st.markdown("*Settings are saved to `config.toml` file. API credentials are stored in session state for security.*")
+
+    # Configuration preview
+    st.markdown("---\n\n### 📋 Current Configuration Preview")
+
+    # Safe config display (without sensitive data), serialized once per config revision
+    with st.expander("Show configuration", expanded=False):
+        st.json(_config_preview_json(get_config_mtime()))